@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Generate src/ai/_tool_validators.py from the tool schemas in ALL_TOOLS.
+
+Each tool gets a validator specialized to its fixed input schema, so
+validate_tool_input is a single dict dispatch into straight-line code.
+
+Regenerate after changing any tool's input_schema:
+    python scripts/gen_tool_validators.py
+
+Check that the committed module is up to date (exit code 1 if stale):
+    python scripts/gen_tool_validators.py --check
+"""
+
+import json
+import sys
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+OUTPUT_FILE = ROOT_DIR / "src" / "ai" / "_tool_validators.py"
+
+sys.path.insert(0, str(ROOT_DIR))
+
+# JSON schema type -> (Python type name, article + name used in error messages)
+SCHEMA_TYPES = {
+    "string": ("str", "a string"),
+    "integer": ("int", "an integer"),
+    "boolean": ("bool", "a boolean"),
+}
+
+HEADER = '''"""Tool input validators generated from ALL_TOOLS input schemas.
+
+Generated by scripts/gen_tool_validators.py - do not edit by hand.
+"""
+
+from typing import Any
+
+_MISSING: Any = object()
+'''
+
+
+def _literal(value: Any) -> str:
+    """Render a str or tuple of str as a double-quoted Python literal."""
+    if not isinstance(value, tuple):
+        return json.dumps(value)
+    items = ", ".join(json.dumps(item) for item in value)
+    return f"({items},)" if len(value) == 1 else f"({items})"
+
+
+def render_validator(name: str, schema: Mapping[str, Any]) -> str:
+    """Render the validator function source for one tool schema."""
+    lines = [
+        "",
+        "",
+        f"def validate_{name}(tool_input: dict[str, Any]) -> list[str]:",
+        "    errors: list[str] = []",
+    ]
+
+    for field in schema.get("required", []):
+        lines += [
+            f"    if {_literal(field)} not in tool_input:",
+            f"        errors.append({_literal(f'Missing required field: {field}')})",
+        ]
+
+    for field, prop in schema.get("properties", {}).items():
+        checks = []
+        if prop.get("type") in SCHEMA_TYPES:
+            type_name, type_label = SCHEMA_TYPES[prop["type"]]
+            checks.append(
+                (f"not isinstance(value, {type_name})", f"Field '{field}' must be {type_label}")
+            )
+        if "enum" in prop:
+            checks.append(
+                (
+                    f"value not in {_literal(tuple(prop['enum']))}",
+                    f"Field '{field}' must be one of: {', '.join(prop['enum'])}",
+                )
+            )
+        if not checks:
+            continue
+
+        lines.append(f"    value = tool_input.get({_literal(field)}, _MISSING)")
+        if len(checks) == 1:
+            condition, message = checks[0]
+            lines += [
+                f"    if value is not _MISSING and {condition}:",
+                f"        errors.append({_literal(message)})",
+            ]
+            continue
+
+        lines.append("    if value is not _MISSING:")
+        for condition, message in checks:
+            lines += [
+                f"        if {condition}:",
+                f"            errors.append({_literal(message)})",
+            ]
+
+    lines.append("    return errors")
+    return "\n".join(lines) + "\n"
+
+
+def render() -> str:
+    """Render the full generated module source."""
+    from src.ai.tools import ALL_TOOLS
+
+    parts = [HEADER]
+    for tool in ALL_TOOLS:
+        parts.append(render_validator(tool["name"], tool.get("input_schema", {})))
+
+    parts.append("\n\nVALIDATORS = {\n")
+    for tool in ALL_TOOLS:
+        parts.append(f'    "{tool["name"]}": validate_{tool["name"]},\n')
+    parts.append("}\n")
+    return "".join(parts)
+
+
+def main() -> int:
+    source = render()
+
+    if "--check" in sys.argv[1:]:
+        if not OUTPUT_FILE.exists() or OUTPUT_FILE.read_text(encoding="utf-8") != source:
+            print(f"{OUTPUT_FILE} is out of date; run scripts/gen_tool_validators.py")
+            return 1
+        return 0
+
+    OUTPUT_FILE.write_text(source, encoding="utf-8")
+    print(f"Wrote {OUTPUT_FILE}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
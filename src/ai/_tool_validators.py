@@ -0,0 +1,623 @@
+"""Tool input validators generated from ALL_TOOLS input schemas.
+
+Generated by scripts/gen_tool_validators.py - do not edit by hand.
+"""
+
+from typing import Any
+
+_MISSING: Any = object()
+
+
+def validate_rutracker_search(tool_input: dict[str, Any]) -> list[str]:
+    errors: list[str] = []
+    if "query" not in tool_input:
+        errors.append("Missing required field: query")
+    value = tool_input.get("query", _MISSING)
+    if value is not _MISSING and not isinstance(value, str):
+        errors.append("Field 'query' must be a string")
+    value = tool_input.get("quality", _MISSING)
+    if value is not _MISSING:
+        if not isinstance(value, str):
+            errors.append("Field 'quality' must be a string")
+        if value not in ("720p", "1080p", "4K", "2160p", "HDR"):
+            errors.append("Field 'quality' must be one of: 720p, 1080p, 4K, 2160p, HDR")
+    value = tool_input.get("category", _MISSING)
+    if value is not _MISSING:
+        if not isinstance(value, str):
+            errors.append("Field 'category' must be a string")
+        if value not in ("movie", "tv_show", "anime", "documentary"):
+            errors.append("Field 'category' must be one of: movie, tv_show, anime, documentary")
+    return errors
+
+
+def validate_piratebay_search(tool_input: dict[str, Any]) -> list[str]:
+    errors: list[str] = []
+    if "query" not in tool_input:
+        errors.append("Missing required field: query")
+    value = tool_input.get("query", _MISSING)
+    if value is not _MISSING and not isinstance(value, str):
+        errors.append("Field 'query' must be a string")
+    value = tool_input.get("quality", _MISSING)
+    if value is not _MISSING:
+        if not isinstance(value, str):
+            errors.append("Field 'quality' must be a string")
+        if value not in ("720p", "1080p", "4K", "2160p"):
+            errors.append("Field 'quality' must be one of: 720p, 1080p, 4K, 2160p")
+    value = tool_input.get("min_seeds", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'min_seeds' must be an integer")
+    return errors
+
+
+def validate_tmdb_search(tool_input: dict[str, Any]) -> list[str]:
+    errors: list[str] = []
+    if "query" not in tool_input:
+        errors.append("Missing required field: query")
+    value = tool_input.get("query", _MISSING)
+    if value is not _MISSING and not isinstance(value, str):
+        errors.append("Field 'query' must be a string")
+    value = tool_input.get("year", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'year' must be an integer")
+    value = tool_input.get("media_type", _MISSING)
+    if value is not _MISSING:
+        if not isinstance(value, str):
+            errors.append("Field 'media_type' must be a string")
+        if value not in ("movie", "tv"):
+            errors.append("Field 'media_type' must be one of: movie, tv")
+    value = tool_input.get("language", _MISSING)
+    if value is not _MISSING and not isinstance(value, str):
+        errors.append("Field 'language' must be a string")
+    return errors
+
+
+def validate_tmdb_person_search(tool_input: dict[str, Any]) -> list[str]:
+    errors: list[str] = []
+    if "query" not in tool_input:
+        errors.append("Missing required field: query")
+    value = tool_input.get("query", _MISSING)
+    if value is not _MISSING and not isinstance(value, str):
+        errors.append("Field 'query' must be a string")
+    return errors
+
+
+def validate_tmdb_credits(tool_input: dict[str, Any]) -> list[str]:
+    errors: list[str] = []
+    if "tmdb_id" not in tool_input:
+        errors.append("Missing required field: tmdb_id")
+    if "media_type" not in tool_input:
+        errors.append("Missing required field: media_type")
+    value = tool_input.get("tmdb_id", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'tmdb_id' must be an integer")
+    value = tool_input.get("media_type", _MISSING)
+    if value is not _MISSING:
+        if not isinstance(value, str):
+            errors.append("Field 'media_type' must be a string")
+        if value not in ("movie", "tv"):
+            errors.append("Field 'media_type' must be one of: movie, tv")
+    return errors
+
+
+def validate_tmdb_tv_details(tool_input: dict[str, Any]) -> list[str]:
+    errors: list[str] = []
+    if "tmdb_id" not in tool_input:
+        errors.append("Missing required field: tmdb_id")
+    value = tool_input.get("tmdb_id", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'tmdb_id' must be an integer")
+    return errors
+
+
+def validate_tmdb_batch_entity_search(tool_input: dict[str, Any]) -> list[str]:
+    errors: list[str] = []
+    return errors
+
+
+def validate_kinopoisk_search(tool_input: dict[str, Any]) -> list[str]:
+    errors: list[str] = []
+    if "query" not in tool_input:
+        errors.append("Missing required field: query")
+    value = tool_input.get("query", _MISSING)
+    if value is not _MISSING and not isinstance(value, str):
+        errors.append("Field 'query' must be a string")
+    value = tool_input.get("year", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'year' must be an integer")
+    return errors
+
+
+def validate_read_core_memory(tool_input: dict[str, Any]) -> list[str]:
+    errors: list[str] = []
+    if "user_id" not in tool_input:
+        errors.append("Missing required field: user_id")
+    value = tool_input.get("user_id", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'user_id' must be an integer")
+    value = tool_input.get("block_name", _MISSING)
+    if value is not _MISSING:
+        if not isinstance(value, str):
+            errors.append("Field 'block_name' must be a string")
+        if value not in ("identity", "preferences", "watch_context", "active_context", "style", "instructions", "blocklist", "learnings"):
+            errors.append("Field 'block_name' must be one of: identity, preferences, watch_context, active_context, style, instructions, blocklist, learnings")
+    return errors
+
+
+def validate_update_core_memory(tool_input: dict[str, Any]) -> list[str]:
+    errors: list[str] = []
+    if "user_id" not in tool_input:
+        errors.append("Missing required field: user_id")
+    if "block_name" not in tool_input:
+        errors.append("Missing required field: block_name")
+    if "content" not in tool_input:
+        errors.append("Missing required field: content")
+    value = tool_input.get("user_id", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'user_id' must be an integer")
+    value = tool_input.get("block_name", _MISSING)
+    if value is not _MISSING:
+        if not isinstance(value, str):
+            errors.append("Field 'block_name' must be a string")
+        if value not in ("preferences", "watch_context", "active_context", "style", "instructions", "blocklist"):
+            errors.append("Field 'block_name' must be one of: preferences, watch_context, active_context, style, instructions, blocklist")
+    value = tool_input.get("content", _MISSING)
+    if value is not _MISSING and not isinstance(value, str):
+        errors.append("Field 'content' must be a string")
+    value = tool_input.get("operation", _MISSING)
+    if value is not _MISSING:
+        if not isinstance(value, str):
+            errors.append("Field 'operation' must be a string")
+        if value not in ("replace", "append", "merge"):
+            errors.append("Field 'operation' must be one of: replace, append, merge")
+    return errors
+
+
+def validate_search_memory_notes(tool_input: dict[str, Any]) -> list[str]:
+    errors: list[str] = []
+    if "user_id" not in tool_input:
+        errors.append("Missing required field: user_id")
+    if "query" not in tool_input:
+        errors.append("Missing required field: query")
+    value = tool_input.get("user_id", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'user_id' must be an integer")
+    value = tool_input.get("query", _MISSING)
+    if value is not _MISSING and not isinstance(value, str):
+        errors.append("Field 'query' must be a string")
+    value = tool_input.get("limit", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'limit' must be an integer")
+    return errors
+
+
+def validate_create_memory_note(tool_input: dict[str, Any]) -> list[str]:
+    errors: list[str] = []
+    if "user_id" not in tool_input:
+        errors.append("Missing required field: user_id")
+    if "content" not in tool_input:
+        errors.append("Missing required field: content")
+    value = tool_input.get("user_id", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'user_id' must be an integer")
+    value = tool_input.get("content", _MISSING)
+    if value is not _MISSING and not isinstance(value, str):
+        errors.append("Field 'content' must be a string")
+    return errors
+
+
+def validate_seedbox_download(tool_input: dict[str, Any]) -> list[str]:
+    errors: list[str] = []
+    if "magnet" not in tool_input:
+        errors.append("Missing required field: magnet")
+    if "user_id" not in tool_input:
+        errors.append("Missing required field: user_id")
+    value = tool_input.get("magnet", _MISSING)
+    if value is not _MISSING and not isinstance(value, str):
+        errors.append("Field 'magnet' must be a string")
+    value = tool_input.get("name", _MISSING)
+    if value is not _MISSING and not isinstance(value, str):
+        errors.append("Field 'name' must be a string")
+    value = tool_input.get("user_id", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'user_id' must be an integer")
+    return errors
+
+
+def validate_add_to_watchlist(tool_input: dict[str, Any]) -> list[str]:
+    errors: list[str] = []
+    if "user_id" not in tool_input:
+        errors.append("Missing required field: user_id")
+    if "tmdb_id" not in tool_input:
+        errors.append("Missing required field: tmdb_id")
+    if "media_type" not in tool_input:
+        errors.append("Missing required field: media_type")
+    if "title" not in tool_input:
+        errors.append("Missing required field: title")
+    value = tool_input.get("user_id", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'user_id' must be an integer")
+    value = tool_input.get("tmdb_id", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'tmdb_id' must be an integer")
+    value = tool_input.get("media_type", _MISSING)
+    if value is not _MISSING:
+        if not isinstance(value, str):
+            errors.append("Field 'media_type' must be a string")
+        if value not in ("movie", "tv"):
+            errors.append("Field 'media_type' must be one of: movie, tv")
+    value = tool_input.get("title", _MISSING)
+    if value is not _MISSING and not isinstance(value, str):
+        errors.append("Field 'title' must be a string")
+    value = tool_input.get("year", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'year' must be an integer")
+    value = tool_input.get("priority", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'priority' must be an integer")
+    value = tool_input.get("notes", _MISSING)
+    if value is not _MISSING and not isinstance(value, str):
+        errors.append("Field 'notes' must be a string")
+    return errors
+
+
+def validate_remove_from_watchlist(tool_input: dict[str, Any]) -> list[str]:
+    errors: list[str] = []
+    if "user_id" not in tool_input:
+        errors.append("Missing required field: user_id")
+    if "tmdb_id" not in tool_input:
+        errors.append("Missing required field: tmdb_id")
+    value = tool_input.get("user_id", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'user_id' must be an integer")
+    value = tool_input.get("tmdb_id", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'tmdb_id' must be an integer")
+    return errors
+
+
+def validate_get_watchlist(tool_input: dict[str, Any]) -> list[str]:
+    errors: list[str] = []
+    if "user_id" not in tool_input:
+        errors.append("Missing required field: user_id")
+    value = tool_input.get("user_id", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'user_id' must be an integer")
+    value = tool_input.get("media_type", _MISSING)
+    if value is not _MISSING:
+        if not isinstance(value, str):
+            errors.append("Field 'media_type' must be a string")
+        if value not in ("movie", "tv"):
+            errors.append("Field 'media_type' must be one of: movie, tv")
+    value = tool_input.get("limit", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'limit' must be an integer")
+    return errors
+
+
+def validate_mark_watched(tool_input: dict[str, Any]) -> list[str]:
+    errors: list[str] = []
+    if "user_id" not in tool_input:
+        errors.append("Missing required field: user_id")
+    if "tmdb_id" not in tool_input:
+        errors.append("Missing required field: tmdb_id")
+    if "media_type" not in tool_input:
+        errors.append("Missing required field: media_type")
+    if "title" not in tool_input:
+        errors.append("Missing required field: title")
+    value = tool_input.get("user_id", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'user_id' must be an integer")
+    value = tool_input.get("tmdb_id", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'tmdb_id' must be an integer")
+    value = tool_input.get("media_type", _MISSING)
+    if value is not _MISSING:
+        if not isinstance(value, str):
+            errors.append("Field 'media_type' must be a string")
+        if value not in ("movie", "tv"):
+            errors.append("Field 'media_type' must be one of: movie, tv")
+    value = tool_input.get("title", _MISSING)
+    if value is not _MISSING and not isinstance(value, str):
+        errors.append("Field 'title' must be a string")
+    value = tool_input.get("year", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'year' must be an integer")
+    value = tool_input.get("review", _MISSING)
+    if value is not _MISSING and not isinstance(value, str):
+        errors.append("Field 'review' must be a string")
+    return errors
+
+
+def validate_rate_content(tool_input: dict[str, Any]) -> list[str]:
+    errors: list[str] = []
+    if "user_id" not in tool_input:
+        errors.append("Missing required field: user_id")
+    if "tmdb_id" not in tool_input:
+        errors.append("Missing required field: tmdb_id")
+    if "rating" not in tool_input:
+        errors.append("Missing required field: rating")
+    value = tool_input.get("user_id", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'user_id' must be an integer")
+    value = tool_input.get("tmdb_id", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'tmdb_id' must be an integer")
+    value = tool_input.get("review", _MISSING)
+    if value is not _MISSING and not isinstance(value, str):
+        errors.append("Field 'review' must be a string")
+    return errors
+
+
+def validate_get_watch_history(tool_input: dict[str, Any]) -> list[str]:
+    errors: list[str] = []
+    if "user_id" not in tool_input:
+        errors.append("Missing required field: user_id")
+    value = tool_input.get("user_id", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'user_id' must be an integer")
+    value = tool_input.get("media_type", _MISSING)
+    if value is not _MISSING:
+        if not isinstance(value, str):
+            errors.append("Field 'media_type' must be a string")
+        if value not in ("movie", "tv"):
+            errors.append("Field 'media_type' must be one of: movie, tv")
+    value = tool_input.get("limit", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'limit' must be an integer")
+    return errors
+
+
+def validate_add_to_blocklist(tool_input: dict[str, Any]) -> list[str]:
+    errors: list[str] = []
+    if "user_id" not in tool_input:
+        errors.append("Missing required field: user_id")
+    if "block_type" not in tool_input:
+        errors.append("Missing required field: block_type")
+    if "block_value" not in tool_input:
+        errors.append("Missing required field: block_value")
+    value = tool_input.get("user_id", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'user_id' must be an integer")
+    value = tool_input.get("block_type", _MISSING)
+    if value is not _MISSING:
+        if not isinstance(value, str):
+            errors.append("Field 'block_type' must be a string")
+        if value not in ("title", "franchise", "genre", "person"):
+            errors.append("Field 'block_type' must be one of: title, franchise, genre, person")
+    value = tool_input.get("block_value", _MISSING)
+    if value is not _MISSING and not isinstance(value, str):
+        errors.append("Field 'block_value' must be a string")
+    value = tool_input.get("block_level", _MISSING)
+    if value is not _MISSING:
+        if not isinstance(value, str):
+            errors.append("Field 'block_level' must be a string")
+        if value not in ("dont_recommend", "never_mention"):
+            errors.append("Field 'block_level' must be one of: dont_recommend, never_mention")
+    value = tool_input.get("notes", _MISSING)
+    if value is not _MISSING and not isinstance(value, str):
+        errors.append("Field 'notes' must be a string")
+    return errors
+
+
+def validate_get_blocklist(tool_input: dict[str, Any]) -> list[str]:
+    errors: list[str] = []
+    if "user_id" not in tool_input:
+        errors.append("Missing required field: user_id")
+    value = tool_input.get("user_id", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'user_id' must be an integer")
+    value = tool_input.get("block_type", _MISSING)
+    if value is not _MISSING:
+        if not isinstance(value, str):
+            errors.append("Field 'block_type' must be a string")
+        if value not in ("title", "franchise", "genre", "person"):
+            errors.append("Field 'block_type' must be one of: title, franchise, genre, person")
+    return errors
+
+
+def validate_create_monitor(tool_input: dict[str, Any]) -> list[str]:
+    errors: list[str] = []
+    if "user_id" not in tool_input:
+        errors.append("Missing required field: user_id")
+    if "title" not in tool_input:
+        errors.append("Missing required field: title")
+    if "quality" not in tool_input:
+        errors.append("Missing required field: quality")
+    value = tool_input.get("user_id", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'user_id' must be an integer")
+    value = tool_input.get("title", _MISSING)
+    if value is not _MISSING and not isinstance(value, str):
+        errors.append("Field 'title' must be a string")
+    value = tool_input.get("tmdb_id", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'tmdb_id' must be an integer")
+    value = tool_input.get("media_type", _MISSING)
+    if value is not _MISSING:
+        if not isinstance(value, str):
+            errors.append("Field 'media_type' must be a string")
+        if value not in ("movie", "tv"):
+            errors.append("Field 'media_type' must be one of: movie, tv")
+    value = tool_input.get("quality", _MISSING)
+    if value is not _MISSING:
+        if not isinstance(value, str):
+            errors.append("Field 'quality' must be a string")
+        if value not in ("720p", "1080p", "4K"):
+            errors.append("Field 'quality' must be one of: 720p, 1080p, 4K")
+    value = tool_input.get("auto_download", _MISSING)
+    if value is not _MISSING and not isinstance(value, bool):
+        errors.append("Field 'auto_download' must be a boolean")
+    value = tool_input.get("tracking_mode", _MISSING)
+    if value is not _MISSING:
+        if not isinstance(value, str):
+            errors.append("Field 'tracking_mode' must be a string")
+        if value not in ("season", "episode"):
+            errors.append("Field 'tracking_mode' must be one of: season, episode")
+    value = tool_input.get("season_number", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'season_number' must be an integer")
+    value = tool_input.get("episode_number", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'episode_number' must be an integer")
+    return errors
+
+
+def validate_get_monitors(tool_input: dict[str, Any]) -> list[str]:
+    errors: list[str] = []
+    if "user_id" not in tool_input:
+        errors.append("Missing required field: user_id")
+    value = tool_input.get("user_id", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'user_id' must be an integer")
+    value = tool_input.get("status", _MISSING)
+    if value is not _MISSING:
+        if not isinstance(value, str):
+            errors.append("Field 'status' must be a string")
+        if value not in ("active", "found", "cancelled"):
+            errors.append("Field 'status' must be one of: active, found, cancelled")
+    return errors
+
+
+def validate_cancel_monitor(tool_input: dict[str, Any]) -> list[str]:
+    errors: list[str] = []
+    if "monitor_id" not in tool_input:
+        errors.append("Missing required field: monitor_id")
+    value = tool_input.get("monitor_id", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'monitor_id' must be an integer")
+    return errors
+
+
+def validate_get_crew_stats(tool_input: dict[str, Any]) -> list[str]:
+    errors: list[str] = []
+    if "user_id" not in tool_input:
+        errors.append("Missing required field: user_id")
+    value = tool_input.get("user_id", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'user_id' must be an integer")
+    value = tool_input.get("role", _MISSING)
+    if value is not _MISSING:
+        if not isinstance(value, str):
+            errors.append("Field 'role' must be a string")
+        if value not in ("director", "cinematographer", "composer", "writer", "actor"):
+            errors.append("Field 'role' must be one of: director, cinematographer, composer, writer, actor")
+    value = tool_input.get("min_films", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'min_films' must be an integer")
+    return errors
+
+
+def validate_letterboxd_sync(tool_input: dict[str, Any]) -> list[str]:
+    errors: list[str] = []
+    if "user_id" not in tool_input:
+        errors.append("Missing required field: user_id")
+    if "letterboxd_username" not in tool_input:
+        errors.append("Missing required field: letterboxd_username")
+    value = tool_input.get("user_id", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'user_id' must be an integer")
+    value = tool_input.get("letterboxd_username", _MISSING)
+    if value is not _MISSING and not isinstance(value, str):
+        errors.append("Field 'letterboxd_username' must be a string")
+    value = tool_input.get("sync_watchlist", _MISSING)
+    if value is not _MISSING and not isinstance(value, bool):
+        errors.append("Field 'sync_watchlist' must be a boolean")
+    value = tool_input.get("sync_diary", _MISSING)
+    if value is not _MISSING and not isinstance(value, bool):
+        errors.append("Field 'sync_diary' must be a boolean")
+    value = tool_input.get("diary_limit", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'diary_limit' must be an integer")
+    return errors
+
+
+def validate_get_industry_news(tool_input: dict[str, Any]) -> list[str]:
+    errors: list[str] = []
+    if "keywords" not in tool_input:
+        errors.append("Missing required field: keywords")
+    value = tool_input.get("hours", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'hours' must be an integer")
+    value = tool_input.get("max_results", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'max_results' must be an integer")
+    return errors
+
+
+def validate_get_recent_news(tool_input: dict[str, Any]) -> list[str]:
+    errors: list[str] = []
+    value = tool_input.get("hours", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'hours' must be an integer")
+    value = tool_input.get("max_results", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'max_results' must be an integer")
+    return errors
+
+
+def validate_get_hidden_gem(tool_input: dict[str, Any]) -> list[str]:
+    errors: list[str] = []
+    if "user_id" not in tool_input:
+        errors.append("Missing required field: user_id")
+    value = tool_input.get("user_id", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'user_id' must be an integer")
+    return errors
+
+
+def validate_get_director_upcoming(tool_input: dict[str, Any]) -> list[str]:
+    errors: list[str] = []
+    if "director_name" not in tool_input:
+        errors.append("Missing required field: director_name")
+    value = tool_input.get("director_name", _MISSING)
+    if value is not _MISSING and not isinstance(value, str):
+        errors.append("Field 'director_name' must be a string")
+    return errors
+
+
+def validate_web_search(tool_input: dict[str, Any]) -> list[str]:
+    errors: list[str] = []
+    if "query" not in tool_input:
+        errors.append("Missing required field: query")
+    value = tool_input.get("query", _MISSING)
+    if value is not _MISSING and not isinstance(value, str):
+        errors.append("Field 'query' must be a string")
+    value = tool_input.get("max_results", _MISSING)
+    if value is not _MISSING and not isinstance(value, int):
+        errors.append("Field 'max_results' must be an integer")
+    return errors
+
+
+VALIDATORS = {
+    "rutracker_search": validate_rutracker_search,
+    "piratebay_search": validate_piratebay_search,
+    "tmdb_search": validate_tmdb_search,
+    "tmdb_person_search": validate_tmdb_person_search,
+    "tmdb_credits": validate_tmdb_credits,
+    "tmdb_tv_details": validate_tmdb_tv_details,
+    "tmdb_batch_entity_search": validate_tmdb_batch_entity_search,
+    "kinopoisk_search": validate_kinopoisk_search,
+    "read_core_memory": validate_read_core_memory,
+    "update_core_memory": validate_update_core_memory,
+    "search_memory_notes": validate_search_memory_notes,
+    "create_memory_note": validate_create_memory_note,
+    "seedbox_download": validate_seedbox_download,
+    "add_to_watchlist": validate_add_to_watchlist,
+    "remove_from_watchlist": validate_remove_from_watchlist,
+    "get_watchlist": validate_get_watchlist,
+    "mark_watched": validate_mark_watched,
+    "rate_content": validate_rate_content,
+    "get_watch_history": validate_get_watch_history,
+    "add_to_blocklist": validate_add_to_blocklist,
+    "get_blocklist": validate_get_blocklist,
+    "create_monitor": validate_create_monitor,
+    "get_monitors": validate_get_monitors,
+    "cancel_monitor": validate_cancel_monitor,
+    "get_crew_stats": validate_get_crew_stats,
+    "letterboxd_sync": validate_letterboxd_sync,
+    "get_industry_news": validate_get_industry_news,
+    "get_recent_news": validate_get_recent_news,
+    "get_hidden_gem": validate_get_hidden_gem,
+    "get_director_upcoming": validate_get_director_upcoming,
+    "web_search": validate_web_search,
+}
@@ -1047,7 +1047,7 @@ CREATE_MEMORY_NOTE_TOOL = {
 # Collection of all tools
 # =============================================================================
 
-ALL_TOOLS: list[dict[str, Any]] = [
+ALL_TOOLS: tuple[dict[str, Any], ...] = (
     # Core search tools
     RUTRACKER_SEARCH_TOOL,
     PIRATEBAY_SEARCH_TOOL,
@@ -1090,7 +1090,7 @@ ALL_TOOLS: list[dict[str, Any]] = [
     GET_DIRECTOR_UPCOMING_TOOL,
     # Web search for current information
     WEB_SEARCH_TOOL,
-]
+)
 
 # Legacy profile tools kept for backward compatibility (handler registration)
 # but no longer sent to Claude API to reduce token usage.
@@ -1101,13 +1101,17 @@ LEGACY_PROFILE_TOOLS: list[dict[str, Any]] = [
 ]
 
 
+# Name -> definition index so lookups don't scan ALL_TOOLS
+_TOOLS_BY_NAME: dict[str, dict[str, Any]] = {tool["name"]: tool for tool in ALL_TOOLS}
+
+
 def get_tool_definitions() -> list[dict[str, Any]]:
     """Get all tool definitions for Claude API.
 
     Returns:
         List of tool definitions in Anthropic format.
     """
-    return ALL_TOOLS.copy()
+    return list(ALL_TOOLS)
 
 
 def get_tool_by_name(name: str) -> dict[str, Any] | None:
@@ -1119,10 +1123,7 @@ def get_tool_by_name(name: str) -> dict[str, Any] | None:
     Returns:
         Tool definition dict or None if not found.
     """
-    for tool in ALL_TOOLS:
-        if tool["name"] == name:
-            return tool
-    return None
+    return _TOOLS_BY_NAME.get(name)
 
 
 # =============================================================================
@@ -1146,6 +1147,7 @@ class ToolExecutor:
     def __init__(self) -> None:
         """Initialize the tool executor with empty handler registry."""
         self._handlers: dict[str, ToolHandler] = {}
+        self._registered_tools: tuple[str, ...] | None = None
         logger.info("tool_executor_initialized")
 
     def register_handler(self, tool_name: str, handler: ToolHandler) -> None:
@@ -1162,6 +1164,7 @@ class ToolExecutor:
             )
 
         self._handlers[tool_name] = handler
+        self._registered_tools = None
         logger.debug(
             "tool_handler_registered",
             tool_name=tool_name,
@@ -1173,8 +1176,19 @@ class ToolExecutor:
         Args:
             handlers: Dict mapping tool names to handler functions.
         """
-        for tool_name, handler in handlers.items():
-            self.register_handler(tool_name, handler)
+        for tool_name in handlers:
+            if get_tool_by_name(tool_name) is None:
+                logger.warning(
+                    "registering_unknown_tool",
+                    tool_name=tool_name,
+                )
+
+        self._handlers.update(handlers)
+        self._registered_tools = None
+        logger.debug(
+            "tool_handlers_registered",
+            count=len(handlers),
+        )
 
     def has_handler(self, tool_name: str) -> bool:
         """Check if a handler is registered for a tool.
@@ -1187,13 +1201,17 @@ class ToolExecutor:
         """
         return tool_name in self._handlers
 
-    def get_registered_tools(self) -> list[str]:
-        """Get list of all registered tool names.
+    def get_registered_tools(self) -> tuple[str, ...]:
+        """Get all registered tool names.
+
+        The tuple is cached until the next handler registration.
 
         Returns:
-            List of tool names with registered handlers.
+            Tuple of tool names with registered handlers.
         """
-        return list(self._handlers.keys())
+        if self._registered_tools is None:
+            self._registered_tools = tuple(self._handlers)
+        return self._registered_tools
 
     async def execute(self, tool_name: str, tool_input: dict[str, Any]) -> str:
         """Execute a tool call.
@@ -1215,7 +1233,8 @@ class ToolExecutor:
             input_keys=list(tool_input.keys()),
         )
 
-        if tool_name not in self._handlers:
+        handler = self._handlers.get(tool_name)
+        if handler is None:
             error_msg = f"No handler registered for tool: {tool_name}"
             logger.error(
                 "tool_handler_not_found",
@@ -1223,8 +1242,6 @@ class ToolExecutor:
             )
             raise ValueError(error_msg)
 
-        handler = self._handlers[tool_name]
-
         try:
             result = await handler(tool_input)
             logger.info(
@@ -1263,6 +1280,17 @@ class ToolExecutor:
 # =============================================================================
 
 
+# Serialized stub response up to the received_input value; only the input
+# itself is encoded per call
+_STUB_RESPONSE_PREFIX = (
+    json.dumps(
+        {"status": "stub", "message": "Handler not implemented yet"},
+        ensure_ascii=False,
+    )[:-1]
+    + ', "received_input": '
+)
+
+
 async def stub_handler(tool_input: dict[str, Any]) -> str:
     """Stub handler for testing - returns input as JSON.
 
@@ -1272,14 +1300,11 @@ async def stub_handler(tool_input: dict[str, Any]) -> str:
     Returns:
         JSON representation of the input with stub marker.
     """
-    return json.dumps(
-        {
-            "status": "stub",
-            "message": "Handler not implemented yet",
-            "received_input": tool_input,
-        },
-        ensure_ascii=False,
-    )
+    return f"{_STUB_RESPONSE_PREFIX}{json.dumps(tool_input, ensure_ascii=False)}}}"
+
+
+# Stub handler for every tool, built once and shared by create_executor_with_stubs
+_STUB_HANDLERS: dict[str, ToolHandler] = {tool["name"]: stub_handler for tool in ALL_TOOLS}
 
 
 def create_executor_with_stubs() -> ToolExecutor:
@@ -1291,8 +1316,7 @@ def create_executor_with_stubs() -> ToolExecutor:
         ToolExecutor with stub handlers registered.
     """
     executor = ToolExecutor()
-    for tool in ALL_TOOLS:
-        executor.register_handler(tool["name"], stub_handler)
+    executor.register_handlers(_STUB_HANDLERS)
     return executor
 
 
@@ -1304,6 +1328,11 @@ def create_executor_with_stubs() -> ToolExecutor:
 def validate_tool_input(tool_name: str, tool_input: dict[str, Any]) -> list[str]:
     """Validate tool input against its JSON schema.
 
+    Dispatches to the validator generated for the tool's schema in
+    src/ai/_tool_validators.py (see scripts/gen_tool_validators.py). The
+    generated module is imported here rather than at module level, so the
+    generator can import this module even when its output is missing or stale.
+
     Args:
         tool_name: Name of the tool.
         tool_input: Input parameters to validate.
@@ -1311,37 +1340,10 @@ def validate_tool_input(tool_name: str, tool_input: dict[str, Any]) -> list[str]
     Returns:
         List of validation error messages (empty if valid).
     """
-    tool = get_tool_by_name(tool_name)
-    if tool is None:
-        return [f"Unknown tool: {tool_name}"]
-
-    schema = tool.get("input_schema", {})
-    errors: list[str] = []
+    from src.ai._tool_validators import VALIDATORS
 
-    # Check required fields
-    required = schema.get("required", [])
-    for field in required:
-        if field not in tool_input:
-            errors.append(f"Missing required field: {field}")
-
-    # Check field types
-    properties = schema.get("properties", {})
-    for field, value in tool_input.items():
-        if field not in properties:
-            continue  # Allow extra fields
-
-        prop_schema = properties[field]
-        expected_type = prop_schema.get("type")
-
-        if expected_type == "string" and not isinstance(value, str):
-            errors.append(f"Field '{field}' must be a string")
-        elif expected_type == "integer" and not isinstance(value, int):
-            errors.append(f"Field '{field}' must be an integer")
-        elif expected_type == "boolean" and not isinstance(value, bool):
-            errors.append(f"Field '{field}' must be a boolean")
-
-        # Check enum values
-        if "enum" in prop_schema and value not in prop_schema["enum"]:
-            errors.append(f"Field '{field}' must be one of: {', '.join(prop_schema['enum'])}")
+    validator = VALIDATORS.get(tool_name)
+    if validator is None:
+        return [f"Unknown tool: {tool_name}"]
 
-    return errors
+    return validator(tool_input)
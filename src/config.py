@@ -56,6 +56,13 @@ class Settings(BaseSettings):
         ...,
         description="Fernet encryption key for sensitive user data",
     )
+    credentials_write_aes_gcm: bool = Field(
+        default=False,
+        description=(
+            "Write new credentials in the AES-GCM v2 format "
+            "(one-way: releases without v2 support cannot read them)"
+        ),
+    )
 
     # Database Configuration (Postgres preferred, SQLite fallback)
     database_url: SecretStr | None = Field(
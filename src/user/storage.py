@@ -17,23 +17,35 @@ Usage:
         user = await storage.create_user(telegram_id=123456)
 """
 
+import asyncio
 import base64
 import json
+import os
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime, timedelta
 from enum import Enum
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Any
+from typing import Any, Protocol, TypeVar, cast
 
 import structlog
-from cryptography.fernet import Fernet
+from cryptography.exceptions import InvalidTag
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from pydantic import BaseModel, Field
 
 logger = structlog.get_logger()
 
 
+def _utcnow() -> datetime:
+    """Return the current UTC time; tests patch this to freeze the clock."""
+    return datetime.now(UTC)
+
+
 # =============================================================================
 # Data Models
 # =============================================================================
@@ -335,6 +347,23 @@ class SyncedTorrent(BaseModel):
     created_at: datetime
 
 
+# Stored form of an empty JSON list column (the schema default)
+_EMPTY_JSON_LIST = "[]"
+
+
+def _loads_json_list(value: str | None) -> list[Any]:
+    """Decode a JSON list column, skipping the parser for the empty default."""
+    if not value or value == _EMPTY_JSON_LIST:
+        return []
+    result: list[Any] = json.loads(value)
+    return result
+
+
+def _dumps_json_list(value: list[Any]) -> str:
+    """Encode a JSON list column, skipping the encoder for an empty list."""
+    return json.dumps(value) if value else _EMPTY_JSON_LIST
+
+
 # Block name constants and limits
 CORE_MEMORY_BLOCKS = {
     "identity": {"max_chars": 500, "agent_editable": False},
@@ -353,36 +382,77 @@ CORE_MEMORY_BLOCKS = {
 # =============================================================================
 
 
+class Cipher(Protocol):
+    """Reversible transform applied to credential values at rest.
+
+    EncryptionHelper is the production implementation; tests that only
+    exercise storage semantics may pass a cheaper one to the storage.
+    """
+
+    def encrypt(self, data: str) -> str:
+        """Encrypt a plaintext value for storage."""
+        ...
+
+    def decrypt(self, encrypted_data: str) -> str:
+        """Decrypt a stored value."""
+        ...
+
+
 class EncryptionHelper:
-    """Helper class for encrypting and decrypting sensitive data."""
+    """Helper class for encrypting and decrypting sensitive data.
 
-    def __init__(self, key: str | bytes):
+    Both formats decrypt: ``v2:`` + urlsafe base64(nonce + ciphertext)
+    sealed with AES-256-GCM under a key derived from the Fernet key, and
+    unprefixed base64-wrapped Fernet tokens. New values are written as
+    Fernet unless write_aead is set; releases before v2 support cannot read
+    ``v2:`` values, so enabling it is a one-way migration.
+    """
+
+    _AEAD_PREFIX = "v2:"
+    _NONCE_SIZE = 12
+
+    def __init__(self, key: str | bytes, write_aead: bool = False):
         """Initialize with Fernet encryption key.
 
         Args:
             key: Fernet key as string or bytes
+            write_aead: Write new values in the AES-GCM ``v2:`` format
         """
         if isinstance(key, str):
             key = key.encode()
         self._fernet = Fernet(key)
+        aead_key = HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=None,
+            info=b"credentials-aes-gcm-v2",
+        ).derive(base64.urlsafe_b64decode(key))
+        self._aead = AESGCM(aead_key)
+        self._write_aead = write_aead
 
     def encrypt(self, data: str) -> str:
-        """Encrypt string data and return base64-encoded result.
+        """Encrypt string data and return base64 encoded result.
 
         Args:
             data: Plain text to encrypt
 
         Returns:
-            Base64-encoded encrypted data
+            Base64 encoded Fernet token, or ``v2:``-prefixed base64 of nonce
+            and AES-GCM ciphertext when write_aead is set
         """
-        encrypted = self._fernet.encrypt(data.encode())
-        return base64.b64encode(encrypted).decode()
+        if not self._write_aead:
+            encrypted = self._fernet.encrypt(data.encode())
+            return base64.b64encode(encrypted).decode()
+
+        nonce = os.urandom(self._NONCE_SIZE)
+        sealed = self._aead.encrypt(nonce, data.encode(), None)
+        return self._AEAD_PREFIX + base64.urlsafe_b64encode(nonce + sealed).decode()
 
     def decrypt(self, encrypted_data: str) -> str:
-        """Decrypt base64-encoded encrypted data.
+        """Decrypt data produced by encrypt() or by the legacy Fernet scheme.
 
         Args:
-            encrypted_data: Base64-encoded encrypted string
+            encrypted_data: Encrypted string
 
         Returns:
             Decrypted plain text
@@ -390,8 +460,37 @@ class EncryptionHelper:
         Raises:
             InvalidToken: If decryption fails (wrong key or corrupted data)
         """
-        encrypted = base64.b64decode(encrypted_data.encode())
-        return self._fernet.decrypt(encrypted).decode()
+        if not encrypted_data.startswith(self._AEAD_PREFIX):
+            encrypted = base64.b64decode(encrypted_data.encode())
+            return self._fernet.decrypt(encrypted).decode()
+
+        try:
+            raw = base64.urlsafe_b64decode(encrypted_data[len(self._AEAD_PREFIX) :])
+            nonce, sealed = raw[: self._NONCE_SIZE], raw[self._NONCE_SIZE :]
+            return self._aead.decrypt(nonce, sealed, None).decode()
+        except (InvalidTag, ValueError) as e:
+            raise InvalidToken from e
+
+
+@lru_cache(maxsize=8)
+def _get_encryption_helper(key: bytes, write_aead: bool = False) -> EncryptionHelper:
+    """Get the shared EncryptionHelper for a key.
+
+    get_storage() builds a storage per call; sharing the helper keeps key
+    parsing and derivation to once per process.
+    """
+    return EncryptionHelper(key, write_aead)
+
+
+def _settings_cipher(encryption_key: str | bytes | None) -> Cipher | None:
+    """Build the credential cipher for a key using the configured write format."""
+    from src.config import settings
+
+    if not encryption_key:
+        return None
+    if isinstance(encryption_key, str):
+        encryption_key = encryption_key.encode()
+    return _get_encryption_helper(encryption_key, settings.credentials_write_aes_gcm)
 
 
 # =============================================================================
@@ -399,18 +498,38 @@ class EncryptionHelper:
 # =============================================================================
 
 
+# sqlite3 prepared-statement cache size per connection (stdlib default is 128)
+SQLITE_CACHED_STATEMENTS = 256
+
+# Connection-level pragmas applied by SQLiteStorage.connect
+SQLITE_CONNECT_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA cache_size = -20000",
+)
+
+
 class BaseStorage(ABC):
     """Abstract base class for storage backends."""
 
-    def __init__(self, encryption_key: str | bytes | None = None):
+    def __init__(
+        self,
+        encryption_key: str | bytes | None = None,
+        cipher: Cipher | None = None,
+    ):
         """Initialize storage with optional encryption.
 
         Args:
             encryption_key: Optional Fernet key for encrypting credentials
+            cipher: Optional Cipher used instead of one built from encryption_key
         """
-        self._encryption: EncryptionHelper | None = None
-        if encryption_key:
-            self._encryption = EncryptionHelper(encryption_key)
+        self._encryption: Cipher | None = cipher
+        if cipher is None and encryption_key:
+            self._encryption = _get_encryption_helper(
+                encryption_key.encode() if isinstance(encryption_key, str) else encryption_key
+            )
 
     @abstractmethod
     async def connect(self) -> None:
@@ -436,6 +555,14 @@ class BaseStorage(ABC):
         """Close database connection."""
         await self.close()
 
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """Group several writes into one commit where the backend supports it.
+
+        The default implementation is a no-op: each write commits on its own.
+        """
+        yield
+
     # -------------------------------------------------------------------------
     # User CRUD
     # -------------------------------------------------------------------------
@@ -452,6 +579,18 @@ class BaseStorage(ABC):
         """Create a new user."""
         pass
 
+    @abstractmethod
+    async def create_users_bulk(self, rows: list[dict[str, Any]]) -> list[User]:
+        """Create many users with default preferences in one transaction.
+
+        Args:
+            rows: Dicts with create_user keyword arguments (telegram_id required)
+
+        Returns:
+            Created users, in the same order as rows
+        """
+        pass
+
     @abstractmethod
     async def get_user(self, user_id: int) -> User | None:
         """Get user by internal ID."""
@@ -548,6 +687,25 @@ class BaseStorage(ABC):
         """Store an encrypted credential."""
         pass
 
+    @abstractmethod
+    async def store_credentials_bulk(
+        self,
+        user_id: int,
+        values: dict[CredentialType, str],
+        expires_at: datetime | None = None,
+    ) -> int:
+        """Store several encrypted credentials for one user in one transaction.
+
+        Args:
+            user_id: Internal user ID
+            values: Plaintext value per credential type
+            expires_at: Optional expiry applied to every credential
+
+        Returns:
+            Number of credentials stored
+        """
+        pass
+
     @abstractmethod
     async def get_credential(
         self,
@@ -680,6 +838,19 @@ class BaseStorage(ABC):
         """Add item to watch history."""
         pass
 
+    @abstractmethod
+    async def add_watched_bulk(self, user_id: int, items: list[dict[str, Any]]) -> int:
+        """Add many items to a user's watch history in one transaction.
+
+        Args:
+            user_id: Internal user ID
+            items: Dicts with add_watched keyword arguments (media_type and title required)
+
+        Returns:
+            Number of items added
+        """
+        pass
+
     @abstractmethod
     async def get_watched(
         self,
@@ -711,6 +882,11 @@ class BaseStorage(ABC):
         """Delete item from watch history."""
         pass
 
+    @abstractmethod
+    async def exists_watched(self, item_id: int) -> bool:
+        """Check if a watch history item exists, without loading it."""
+        pass
+
     @abstractmethod
     async def update_watched_rating(
         self,
@@ -1386,23 +1562,111 @@ class BaseStorage(ABC):
 # =============================================================================
 
 
+_WriteMethod = TypeVar("_WriteMethod", bound=Callable[..., Awaitable[Any]])
+
+
+def _serialized_write(method: _WriteMethod) -> _WriteMethod:
+    """Run a SQLiteStorage write method under the storage's write lock.
+
+    A write from a task that doesn't own the open transaction() waits for it
+    to finish, so it can't land in (and be rolled back with) another task's
+    transaction.
+    """
+
+    @wraps(method)
+    async def wrapper(self: "SQLiteStorage", *args: Any, **kwargs: Any) -> Any:
+        async with self._write_lock():
+            return await method(self, *args, **kwargs)
+
+    return cast(_WriteMethod, wrapper)
+
+
 class SQLiteStorage(BaseStorage):
     """SQLite-based user profile storage with encryption support."""
 
+    # Hot-path statements, kept as constants so the SQL text is identical on
+    # every call and hits sqlite3's per-connection statement cache.
+    # _row_to_user / _row_to_watched read rows by position, so every query
+    # feeding them selects exactly these columns in this order.
+    _USER_COLUMNS = (
+        "id, telegram_id, username, first_name, last_name, language_code, "
+        "is_active, created_at, updated_at"
+    )
+    _USER_COLUMNS_U = "u." + _USER_COLUMNS.replace(", ", ", u.")
+    _WATCHED_COLUMNS = (
+        "id, user_id, media_type, tmdb_id, kinopoisk_id, title, year, "
+        "season, episode, rating, review, watched_at, created_at"
+    )
+    _SQL_INSERT_USER = """
+        INSERT INTO users (telegram_id, username, first_name, last_name,
+                         language_code, is_active, created_at, updated_at)
+        VALUES (?, ?, ?, ?, ?, 1, ?, ?)
+    """
+    _SQL_INSERT_DEFAULT_PREFERENCES = (
+        "INSERT INTO preferences (user_id, created_at, updated_at) VALUES (?, ?, ?)"
+    )
+    _SQL_GET_USER = f"SELECT {_USER_COLUMNS} FROM users WHERE id = ?"
+    _SQL_GET_USER_BY_TG = f"SELECT {_USER_COLUMNS} FROM users WHERE telegram_id = ?"
+    _SQL_DELETE_USER = "DELETE FROM users WHERE id = ?"
+    _SQL_UPSERT_CREDENTIAL = """
+        INSERT INTO credentials
+            (user_id, credential_type, encrypted_value, expires_at, created_at, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT(user_id, credential_type) DO UPDATE SET
+            encrypted_value = excluded.encrypted_value,
+            expires_at = excluded.expires_at,
+            updated_at = excluded.updated_at
+    """
+    # Expiry is checked in SQL; julianday() compares ISO timestamps with any
+    # UTC offset without parsing them in Python
+    _SQL_GET_CREDENTIAL = """
+        SELECT encrypted_value,
+               expires_at IS NULL OR julianday(expires_at) > julianday(?) AS is_live
+        FROM credentials WHERE user_id = ? AND credential_type = ?
+    """
+    _SQL_ADD_WATCHED = """
+        INSERT INTO watched
+            (user_id, media_type, tmdb_id, kinopoisk_id, title, year,
+             season, episode, rating, review, watched_at, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    _SQL_GET_WATCHED_ALL = (
+        f"SELECT {_WATCHED_COLUMNS} FROM watched WHERE user_id = ?"
+        " ORDER BY watched_at DESC LIMIT ? OFFSET ?"
+    )
+    _SQL_GET_WATCHED_BY_TYPE = (
+        f"SELECT {_WATCHED_COLUMNS} FROM watched WHERE user_id = ? AND media_type = ?"
+        " ORDER BY watched_at DESC LIMIT ? OFFSET ?"
+    )
+    _SQL_IS_WATCHED_ANY = (
+        "SELECT 1 FROM watched WHERE user_id = ? AND (tmdb_id = ? OR kinopoisk_id = ?) LIMIT 1"
+    )
+    _SQL_IS_WATCHED_TMDB = "SELECT 1 FROM watched WHERE user_id = ? AND tmdb_id = ? LIMIT 1"
+    _SQL_IS_WATCHED_KP = "SELECT 1 FROM watched WHERE user_id = ? AND kinopoisk_id = ? LIMIT 1"
+    _SQL_EXISTS_WATCHED = "SELECT 1 FROM watched WHERE id = ? LIMIT 1"
+
     def __init__(
         self,
         db_path: str | Path,
         encryption_key: str | bytes | None = None,
+        cipher: Cipher | None = None,
     ):
         """Initialize SQLite storage.
 
         Args:
             db_path: Path to SQLite database file
             encryption_key: Optional Fernet key for encrypting credentials
+            cipher: Optional Cipher used instead of one built from encryption_key
         """
-        super().__init__(encryption_key)
+        super().__init__(encryption_key, cipher)
         self._db_path = Path(db_path)
         self._db: Any = None
+        # Serializes writes across tasks; the task holding it is the only one
+        # that may write, and transaction() keeps it for the whole block
+        self._transaction_lock = asyncio.Lock()
+        self._lock_owner: asyncio.Task[Any] | None = None
+        # transaction() nesting depth of the lock owner
+        self._transaction_depth = 0
 
     async def connect(self) -> None:
         """Open database connection and initialize schema."""
@@ -1411,12 +1675,18 @@ class SQLiteStorage(BaseStorage):
         # Ensure parent directory exists
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        self._db = await aiosqlite.connect(self._db_path)
+        self._db = await aiosqlite.connect(
+            self._db_path, cached_statements=SQLITE_CACHED_STATEMENTS
+        )
         self._db.row_factory = aiosqlite.Row
 
         # Enable foreign keys
         await self._db.execute("PRAGMA foreign_keys = ON")
 
+        # WAL with synchronous=NORMAL avoids an fsync per commit; the bot does
+        # many small writes (users, watched, memory notes)
+        await self._db.executescript(";\n".join(SQLITE_CONNECT_PRAGMAS))
+
         # Apply migrations
         await self._apply_migrations()
 
@@ -1426,6 +1696,70 @@ class SQLiteStorage(BaseStorage):
             await self._db.close()
             self._db = None
 
+    @asynccontextmanager
+    async def _write_lock(self) -> AsyncIterator[None]:
+        """Hold the write lock for the current task; re-entrant within that task."""
+        task = asyncio.current_task()
+        if self._lock_owner is task:
+            yield
+            return
+
+        async with self._transaction_lock:
+            self._lock_owner = task
+            try:
+                yield
+            finally:
+                self._lock_owner = None
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """Run the enclosed writes in one transaction with a single commit.
+
+        Writes made on this storage inside the block skip their own commit;
+        the block commits once on exit or rolls everything back on error.
+        A nested call from the same task runs in a savepoint of the outer
+        transaction, so an error inside it undoes only the nested block's
+        writes. Writes and transactions from other tasks, including tasks
+        spawned inside the block, wait until the block finishes, so don't
+        await such tasks from inside it.
+
+        Example:
+            async with storage.transaction():
+                for title in titles:
+                    await storage.add_watched(user_id, "movie", title)
+        """
+        async with self._write_lock():
+            depth = self._transaction_depth
+            if depth:
+                savepoint = f"nested_{depth}"
+                await self.db.execute(f"SAVEPOINT {savepoint}")
+                self._transaction_depth = depth + 1
+                try:
+                    yield
+                    await self.db.execute(f"RELEASE {savepoint}")
+                except BaseException:
+                    await self.db.execute(f"ROLLBACK TO {savepoint}")
+                    await self.db.execute(f"RELEASE {savepoint}")
+                    raise
+                finally:
+                    self._transaction_depth = depth
+            else:
+                await self.db.execute("BEGIN IMMEDIATE")
+                self._transaction_depth = 1
+                try:
+                    yield
+                    await self.db.commit()
+                except BaseException:
+                    await self.db.rollback()
+                    raise
+                finally:
+                    self._transaction_depth = 0
+
+    async def _commit(self) -> None:
+        """Commit, unless the calling write runs inside a transaction() block."""
+        if not self._transaction_depth:
+            await self.db.commit()
+
     @property
     def db(self) -> Any:
         """Get active database connection."""
@@ -1756,21 +2090,33 @@ class SQLiteStorage(BaseStorage):
             """
             ALTER TABLE digest_history ADD COLUMN topics_summary TEXT;
             """,
+            # Migration 26: Per-user watch history index matching get_watched's
+            # ORDER BY; drops indexes already covered by users.telegram_id UNIQUE
+            # and by the new index's user_id prefix
+            """
+            CREATE INDEX IF NOT EXISTS idx_watched_user_time ON watched(user_id, watched_at DESC);
+            DROP INDEX IF EXISTS idx_watched_user_id;
+            DROP INDEX IF EXISTS idx_users_telegram_id;
+            """,
+            # Migration 27: Per-user indexes for is_watched lookups; drops the
+            # credentials user_id index already covered by its UNIQUE constraint
+            """
+            CREATE INDEX IF NOT EXISTS idx_watched_user_tmdb ON watched(user_id, tmdb_id);
+            CREATE INDEX IF NOT EXISTS idx_watched_user_kp ON watched(user_id, kinopoisk_id);
+            DROP INDEX IF EXISTS idx_credentials_user_id;
+            """,
         ]
 
-        # Get current migration version
-        try:
-            cursor = await self.db.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name='_migrations'"
-            )
-            if await cursor.fetchone() is None:
-                current_version = 0
-            else:
-                cursor = await self.db.execute("SELECT MAX(version) FROM _migrations")
-                row = await cursor.fetchone()
-                current_version = row[0] if row and row[0] else 0
-        except Exception:
-            current_version = 0
+        # Get current migration version. PRAGMA user_version is a single integer
+        # read, so an up-to-date database skips the migration block entirely.
+        cursor = await self.db.execute("PRAGMA user_version")
+        row = await cursor.fetchone()
+        stored_version = row[0] if row else 0
+        if stored_version >= len(migrations):
+            return
+
+        # Databases created before user_version was tracked fall back to _migrations
+        current_version = stored_version or await self._get_legacy_migration_version()
 
         # Apply pending migrations
         for i, sql in enumerate(migrations, 1):
@@ -1784,16 +2130,34 @@ class SQLiteStorage(BaseStorage):
             if i >= 5:  # Only record after _migrations table exists
                 await self.db.execute(
                     "INSERT OR IGNORE INTO _migrations (version, name, applied_at) VALUES (?, ?, ?)",
-                    (i, f"migration_{i}", datetime.now(UTC).isoformat()),
+                    (i, f"migration_{i}", _utcnow().isoformat()),
                 )
 
             await self.db.commit()
             logger.info("migration_applied", version=i)
 
+        await self.db.execute(f"PRAGMA user_version = {len(migrations)}")
+        await self.db.commit()
+
+    async def _get_legacy_migration_version(self) -> int:
+        """Read the schema version from the _migrations audit table."""
+        try:
+            cursor = await self.db.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name='_migrations'"
+            )
+            if await cursor.fetchone() is None:
+                return 0
+            cursor = await self.db.execute("SELECT MAX(version) FROM _migrations")
+            row = await cursor.fetchone()
+            return row[0] if row and row[0] else 0
+        except Exception:
+            return 0
+
     # -------------------------------------------------------------------------
     # User CRUD Implementation
     # -------------------------------------------------------------------------
 
+    @_serialized_write
     async def create_user(
         self,
         telegram_id: int,
@@ -1803,28 +2167,22 @@ class SQLiteStorage(BaseStorage):
         language_code: str | None = "ru",
     ) -> User:
         """Create a new user."""
-        now = datetime.now(UTC).isoformat()
+        now = _utcnow()
+        now_str = now.isoformat()
 
         cursor = await self.db.execute(
-            """
-            INSERT INTO users (telegram_id, username, first_name, last_name,
-                             language_code, is_active, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, 1, ?, ?)
-            """,
-            (telegram_id, username, first_name, last_name, language_code, now, now),
+            self._SQL_INSERT_USER,
+            (telegram_id, username, first_name, last_name, language_code, now_str, now_str),
         )
-        await self.db.commit()
+        await self._commit()
 
         user_id = cursor.lastrowid
         if user_id is None:
             raise RuntimeError("Failed to create user")
 
         # Create default preferences
-        await self.db.execute(
-            "INSERT INTO preferences (user_id, created_at, updated_at) VALUES (?, ?, ?)",
-            (user_id, now, now),
-        )
-        await self.db.commit()
+        await self.db.execute(self._SQL_INSERT_DEFAULT_PREFERENCES, (user_id, now_str, now_str))
+        await self._commit()
 
         logger.info("user_created", user_id=user_id, telegram_id=telegram_id)
 
@@ -1836,22 +2194,67 @@ class SQLiteStorage(BaseStorage):
             last_name=last_name,
             language_code=language_code,
             is_active=True,
-            created_at=datetime.fromisoformat(now),
-            updated_at=datetime.fromisoformat(now),
+            created_at=now,
+            updated_at=now,
         )
 
+    async def create_users_bulk(self, rows: list[dict[str, Any]]) -> list[User]:
+        """Create many users with default preferences in one transaction."""
+        if not rows:
+            return []
+
+        now = _utcnow().isoformat()
+        telegram_ids = [row["telegram_id"] for row in rows]
+
+        async with self.transaction():
+            await self.db.executemany(
+                self._SQL_INSERT_USER,
+                [
+                    (
+                        row["telegram_id"],
+                        row.get("username"),
+                        row.get("first_name"),
+                        row.get("last_name"),
+                        row.get("language_code", "ru"),
+                        now,
+                        now,
+                    )
+                    for row in rows
+                ],
+            )
+
+            placeholders = ", ".join("?" * len(telegram_ids))
+            cursor = await self.db.execute(
+                f"SELECT {self._USER_COLUMNS} FROM users WHERE telegram_id IN ({placeholders})",
+                telegram_ids,
+            )
+            by_telegram_id = {
+                user.telegram_id: user
+                for user in (self._row_to_user(row) for row in await cursor.fetchall())
+            }
+
+            # Create default preferences
+            await self.db.executemany(
+                self._SQL_INSERT_DEFAULT_PREFERENCES,
+                [(user.id, now, now) for user in by_telegram_id.values()],
+            )
+
+        logger.info("users_created", count=len(rows))
+        return [by_telegram_id[telegram_id] for telegram_id in telegram_ids]
+
     async def get_user(self, user_id: int) -> User | None:
         """Get user by internal ID."""
-        cursor = await self.db.execute("SELECT * FROM users WHERE id = ?", (user_id,))
+        cursor = await self.db.execute(self._SQL_GET_USER, (user_id,))
         row = await cursor.fetchone()
         return self._row_to_user(row) if row else None
 
     async def get_user_by_telegram_id(self, telegram_id: int) -> User | None:
         """Get user by Telegram ID."""
-        cursor = await self.db.execute("SELECT * FROM users WHERE telegram_id = ?", (telegram_id,))
+        cursor = await self.db.execute(self._SQL_GET_USER_BY_TG, (telegram_id,))
         row = await cursor.fetchone()
         return self._row_to_user(row) if row else None
 
+    @_serialized_write
     async def update_user(
         self,
         user_id: int,
@@ -1885,21 +2288,22 @@ class SQLiteStorage(BaseStorage):
             return await self.get_user(user_id)
 
         updates.append("updated_at = ?")
-        params.append(datetime.now(UTC).isoformat())
+        params.append(_utcnow().isoformat())
         params.append(user_id)
 
         await self.db.execute(
             f"UPDATE users SET {', '.join(updates)} WHERE id = ?",
             params,
         )
-        await self.db.commit()
+        await self._commit()
 
         return await self.get_user(user_id)
 
+    @_serialized_write
     async def delete_user(self, user_id: int) -> bool:
         """Delete user and all related data."""
-        cursor = await self.db.execute("DELETE FROM users WHERE id = ?", (user_id,))
-        await self.db.commit()
+        cursor = await self.db.execute(self._SQL_DELETE_USER, (user_id,))
+        await self._commit()
         deleted = cursor.rowcount > 0 if cursor.rowcount else False
         if deleted:
             logger.info("user_deleted", user_id=user_id)
@@ -1912,7 +2316,7 @@ class SQLiteStorage(BaseStorage):
         offset: int = 0,
     ) -> list[User]:
         """List users with pagination."""
-        query = "SELECT * FROM users"
+        query = f"SELECT {self._USER_COLUMNS} FROM users"
         params: list[int] = []
 
         if active_only:
@@ -1926,23 +2330,24 @@ class SQLiteStorage(BaseStorage):
         return [self._row_to_user(row) for row in rows]
 
     def _row_to_user(self, row: Any) -> User:
-        """Convert database row to User model."""
+        """Convert a row of _USER_COLUMNS to User model."""
         return User(
-            id=row["id"],
-            telegram_id=row["telegram_id"],
-            username=row["username"],
-            first_name=row["first_name"],
-            last_name=row["last_name"],
-            language_code=row["language_code"],
-            is_active=bool(row["is_active"]),
-            created_at=datetime.fromisoformat(row["created_at"]),
-            updated_at=datetime.fromisoformat(row["updated_at"]),
+            id=row[0],
+            telegram_id=row[1],
+            username=row[2],
+            first_name=row[3],
+            last_name=row[4],
+            language_code=row[5],
+            is_active=bool(row[6]),
+            created_at=datetime.fromisoformat(row[7]),
+            updated_at=datetime.fromisoformat(row[8]),
         )
 
     # -------------------------------------------------------------------------
     # Credentials CRUD Implementation
     # -------------------------------------------------------------------------
 
+    @_serialized_write
     async def store_credential(
         self,
         user_id: int,
@@ -1955,22 +2360,15 @@ class SQLiteStorage(BaseStorage):
             raise RuntimeError("Encryption key not configured")
 
         encrypted_value = self._encryption.encrypt(value)
-        now = datetime.now(UTC).isoformat()
+        now = _utcnow()
+        now_str = now.isoformat()
         expires_str = expires_at.isoformat() if expires_at else None
 
         cursor = await self.db.execute(
-            """
-            INSERT INTO credentials
-                (user_id, credential_type, encrypted_value, expires_at, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-            ON CONFLICT(user_id, credential_type) DO UPDATE SET
-                encrypted_value = excluded.encrypted_value,
-                expires_at = excluded.expires_at,
-                updated_at = excluded.updated_at
-            """,
-            (user_id, credential_type.value, encrypted_value, expires_str, now, now),
+            self._SQL_UPSERT_CREDENTIAL,
+            (user_id, credential_type.value, encrypted_value, expires_str, now_str, now_str),
         )
-        await self.db.commit()
+        await self._commit()
 
         credential_id = cursor.lastrowid
         if credential_id is None:
@@ -1993,10 +2391,42 @@ class SQLiteStorage(BaseStorage):
             credential_type=credential_type,
             encrypted_value=encrypted_value,
             expires_at=expires_at,
-            created_at=datetime.fromisoformat(now),
-            updated_at=datetime.fromisoformat(now),
+            created_at=now,
+            updated_at=now,
         )
 
+    async def store_credentials_bulk(
+        self,
+        user_id: int,
+        values: dict[CredentialType, str],
+        expires_at: datetime | None = None,
+    ) -> int:
+        """Store several encrypted credentials for one user in one transaction."""
+        if self._encryption is None:
+            raise RuntimeError("Encryption key not configured")
+        if not values:
+            return 0
+
+        # Encrypt everything up front so the DB sees a single batch
+        encrypted = [
+            (credential_type.value, self._encryption.encrypt(value))
+            for credential_type, value in values.items()
+        ]
+        now = _utcnow().isoformat()
+        expires_str = expires_at.isoformat() if expires_at else None
+
+        async with self.transaction():
+            await self.db.executemany(
+                self._SQL_UPSERT_CREDENTIAL,
+                [
+                    (user_id, credential_type, encrypted_value, expires_str, now, now)
+                    for credential_type, encrypted_value in encrypted
+                ],
+            )
+
+        logger.info("credentials_stored", user_id=user_id, count=len(encrypted))
+        return len(encrypted)
+
     async def get_credential(
         self,
         user_id: int,
@@ -2007,26 +2437,26 @@ class SQLiteStorage(BaseStorage):
             raise RuntimeError("Encryption key not configured")
 
         cursor = await self.db.execute(
-            "SELECT encrypted_value, expires_at FROM credentials WHERE user_id = ? AND credential_type = ?",
-            (user_id, credential_type.value),
+            self._SQL_GET_CREDENTIAL,
+            (_utcnow().isoformat(), user_id, credential_type.value),
         )
         row = await cursor.fetchone()
 
         if row is None:
             return None
 
-        if row["expires_at"]:
-            expires_at = datetime.fromisoformat(row["expires_at"])
-            if expires_at < datetime.now(UTC):
-                logger.warning(
-                    "credential_expired",
-                    user_id=user_id,
-                    credential_type=credential_type.value,
-                )
-                return None
+        encrypted_value, is_live = row
+        if not is_live:
+            logger.warning(
+                "credential_expired",
+                user_id=user_id,
+                credential_type=credential_type.value,
+            )
+            return None
 
-        return self._encryption.decrypt(row["encrypted_value"])
+        return self._encryption.decrypt(encrypted_value)
 
+    @_serialized_write
     async def delete_credential(
         self,
         user_id: int,
@@ -2037,7 +2467,7 @@ class SQLiteStorage(BaseStorage):
             "DELETE FROM credentials WHERE user_id = ? AND credential_type = ?",
             (user_id, credential_type.value),
         )
-        await self.db.commit()
+        await self._commit()
         deleted = cursor.rowcount > 0 if cursor.rowcount else False
         if deleted:
             logger.info(
@@ -2066,6 +2496,7 @@ class SQLiteStorage(BaseStorage):
         row = await cursor.fetchone()
         return self._row_to_preference(row) if row else None
 
+    @_serialized_write
     async def update_preferences(
         self,
         user_id: int,
@@ -2101,10 +2532,10 @@ class SQLiteStorage(BaseStorage):
             params.append(subtitle_language)
         if preferred_genres is not None:
             updates.append("preferred_genres = ?")
-            params.append(json.dumps(preferred_genres))
+            params.append(_dumps_json_list(preferred_genres))
         if excluded_genres is not None:
             updates.append("excluded_genres = ?")
-            params.append(json.dumps(excluded_genres))
+            params.append(_dumps_json_list(excluded_genres))
         if auto_download is not None:
             updates.append("auto_download = ?")
             params.append(1 if auto_download else 0)
@@ -2131,14 +2562,14 @@ class SQLiteStorage(BaseStorage):
             return existing
 
         updates.append("updated_at = ?")
-        params.append(datetime.now(UTC).isoformat())
+        params.append(_utcnow().isoformat())
         params.append(user_id)
 
         await self.db.execute(
             f"UPDATE preferences SET {', '.join(updates)} WHERE user_id = ?",
             params,
         )
-        await self.db.commit()
+        await self._commit()
 
         logger.info("preferences_updated", user_id=user_id)
         return await self.get_preferences(user_id)
@@ -2151,8 +2582,8 @@ class SQLiteStorage(BaseStorage):
             video_quality=row["video_quality"],
             audio_language=row["audio_language"],
             subtitle_language=row["subtitle_language"],
-            preferred_genres=json.loads(row["preferred_genres"] or "[]"),
-            excluded_genres=json.loads(row["excluded_genres"] or "[]"),
+            preferred_genres=_loads_json_list(row["preferred_genres"]),
+            excluded_genres=_loads_json_list(row["excluded_genres"]),
             auto_download=bool(row["auto_download"]),
             notification_enabled=bool(row["notification_enabled"]),
             claude_model=row.get("claude_model", "claude-sonnet-4-5-20250929"),
@@ -2168,6 +2599,7 @@ class SQLiteStorage(BaseStorage):
     # Watched Items CRUD Implementation
     # -------------------------------------------------------------------------
 
+    @_serialized_write
     async def add_watched(
         self,
         user_id: int,
@@ -2183,16 +2615,11 @@ class SQLiteStorage(BaseStorage):
         watched_at: datetime | None = None,
     ) -> WatchedItem:
         """Add item to watch history."""
-        now = datetime.now(UTC)
+        now = _utcnow()
         watched_at = watched_at or now
 
         cursor = await self.db.execute(
-            """
-            INSERT INTO watched
-                (user_id, media_type, tmdb_id, kinopoisk_id, title, year,
-                 season, episode, rating, review, watched_at, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+            self._SQL_ADD_WATCHED,
             (
                 user_id,
                 media_type,
@@ -2208,7 +2635,7 @@ class SQLiteStorage(BaseStorage):
                 now.isoformat(),
             ),
         )
-        await self.db.commit()
+        await self._commit()
 
         item_id = cursor.lastrowid
         if item_id is None:
@@ -2232,6 +2659,38 @@ class SQLiteStorage(BaseStorage):
             created_at=now,
         )
 
+    async def add_watched_bulk(self, user_id: int, items: list[dict[str, Any]]) -> int:
+        """Add many items to a user's watch history in one transaction."""
+        if not items:
+            return 0
+
+        now = _utcnow().isoformat()
+
+        async with self.transaction():
+            await self.db.executemany(
+                self._SQL_ADD_WATCHED,
+                [
+                    (
+                        user_id,
+                        item["media_type"],
+                        item.get("tmdb_id"),
+                        item.get("kinopoisk_id"),
+                        item["title"],
+                        item.get("year"),
+                        item.get("season"),
+                        item.get("episode"),
+                        item.get("rating"),
+                        item.get("review"),
+                        item["watched_at"].isoformat() if item.get("watched_at") else now,
+                        now,
+                    )
+                    for item in items
+                ],
+            )
+
+        logger.info("watched_added_bulk", user_id=user_id, count=len(items))
+        return len(items)
+
     async def get_watched(
         self,
         user_id: int,
@@ -2240,15 +2699,12 @@ class SQLiteStorage(BaseStorage):
         offset: int = 0,
     ) -> list[WatchedItem]:
         """Get user's watch history."""
-        query = "SELECT * FROM watched WHERE user_id = ?"
-        params: list[Any] = [user_id]
-
         if media_type:
-            query += " AND media_type = ?"
-            params.append(media_type)
-
-        query += " ORDER BY watched_at DESC LIMIT ? OFFSET ?"
-        params.extend([limit, offset])
+            query = self._SQL_GET_WATCHED_BY_TYPE
+            params: tuple[Any, ...] = (user_id, media_type, limit, offset)
+        else:
+            query = self._SQL_GET_WATCHED_ALL
+            params = (user_id, limit, offset)
 
         cursor = await self.db.execute(query, params)
         rows = await cursor.fetchall()
@@ -2265,14 +2721,14 @@ class SQLiteStorage(BaseStorage):
             return False
 
         if tmdb_id and kinopoisk_id:
-            query = "SELECT 1 FROM watched WHERE user_id = ? AND (tmdb_id = ? OR kinopoisk_id = ?) LIMIT 1"
-            params = [user_id, tmdb_id, kinopoisk_id]
+            query = self._SQL_IS_WATCHED_ANY
+            params: tuple[Any, ...] = (user_id, tmdb_id, kinopoisk_id)
         elif tmdb_id:
-            query = "SELECT 1 FROM watched WHERE user_id = ? AND tmdb_id = ? LIMIT 1"
-            params = [user_id, tmdb_id]
+            query = self._SQL_IS_WATCHED_TMDB
+            params = (user_id, tmdb_id)
         else:
-            query = "SELECT 1 FROM watched WHERE user_id = ? AND kinopoisk_id = ? LIMIT 1"
-            params = [user_id, kinopoisk_id]
+            query = self._SQL_IS_WATCHED_KP
+            params = (user_id, kinopoisk_id)
 
         cursor = await self.db.execute(query, params)
         return await cursor.fetchone() is not None
@@ -2285,12 +2741,19 @@ class SQLiteStorage(BaseStorage):
         )
         return await cursor.fetchone() is not None
 
+    @_serialized_write
     async def delete_watched(self, item_id: int) -> bool:
         """Delete item from watch history."""
         cursor = await self.db.execute("DELETE FROM watched WHERE id = ?", (item_id,))
-        await self.db.commit()
+        await self._commit()
         return cursor.rowcount > 0 if cursor.rowcount else False
 
+    async def exists_watched(self, item_id: int) -> bool:
+        """Check if a watch history item exists, without loading it."""
+        cursor = await self.db.execute(self._SQL_EXISTS_WATCHED, (item_id,))
+        return await cursor.fetchone() is not None
+
+    @_serialized_write
     async def update_watched_rating(
         self,
         user_id: int,
@@ -2327,17 +2790,18 @@ class SQLiteStorage(BaseStorage):
             f"UPDATE watched SET {', '.join(updates)} WHERE {where_clause}",
             params,
         )
-        await self.db.commit()
+        await self._commit()
 
         # Fetch updated item
         if tmdb_id:
             cursor = await self.db.execute(
-                "SELECT * FROM watched WHERE user_id = ? AND tmdb_id = ?",
+                f"SELECT {self._WATCHED_COLUMNS} FROM watched WHERE user_id = ? AND tmdb_id = ?",
                 (user_id, tmdb_id),
             )
         else:
             cursor = await self.db.execute(
-                "SELECT * FROM watched WHERE user_id = ? AND kinopoisk_id = ?",
+                f"SELECT {self._WATCHED_COLUMNS} FROM watched"
+                " WHERE user_id = ? AND kinopoisk_id = ?",
                 (user_id, kinopoisk_id),
             )
 
@@ -2345,21 +2809,21 @@ class SQLiteStorage(BaseStorage):
         return self._row_to_watched(row) if row else None
 
     def _row_to_watched(self, row: Any) -> WatchedItem:
-        """Convert database row to WatchedItem model."""
+        """Convert a row of _WATCHED_COLUMNS to WatchedItem model."""
         return WatchedItem(
-            id=row["id"],
-            user_id=row["user_id"],
-            media_type=row["media_type"],
-            tmdb_id=row["tmdb_id"],
-            kinopoisk_id=row["kinopoisk_id"],
-            title=row["title"],
-            year=row["year"],
-            season=row["season"],
-            episode=row["episode"],
-            rating=row["rating"],
-            review=row["review"],
-            watched_at=datetime.fromisoformat(row["watched_at"]),
-            created_at=datetime.fromisoformat(row["created_at"]),
+            id=row[0],
+            user_id=row[1],
+            media_type=row[2],
+            tmdb_id=row[3],
+            kinopoisk_id=row[4],
+            title=row[5],
+            year=row[6],
+            season=row[7],
+            episode=row[8],
+            rating=row[9],
+            review=row[10],
+            watched_at=datetime.fromisoformat(row[11]),
+            created_at=datetime.fromisoformat(row[12]),
         )
 
     async def get_watched_without_tmdb_data(
@@ -2368,8 +2832,8 @@ class SQLiteStorage(BaseStorage):
     ) -> list[WatchedItem]:
         """Get watched items that don't have TMDB data (for enrichment)."""
         cursor = await self.db.execute(
-            """
-            SELECT * FROM watched
+            f"""
+            SELECT {self._WATCHED_COLUMNS} FROM watched
             WHERE tmdb_id IS NULL AND title IS NOT NULL
             AND (tmdb_enrichment_failed IS NULL OR tmdb_enrichment_failed = FALSE)
             ORDER BY watched_at DESC
@@ -2380,14 +2844,16 @@ class SQLiteStorage(BaseStorage):
         rows = await cursor.fetchall()
         return [self._row_to_watched(row) for row in rows]
 
+    @_serialized_write
     async def mark_tmdb_enrichment_failed(self, watched_id: int) -> None:
         """Mark a watched item as failed for TMDB enrichment."""
         await self.db.execute(
             "UPDATE watched SET tmdb_enrichment_failed = TRUE WHERE id = ?",
             (watched_id,),
         )
-        await self.db.commit()
+        await self._commit()
 
+    @_serialized_write
     async def update_watched_tmdb_data(
         self,
         watched_id: int,
@@ -2401,19 +2867,21 @@ class SQLiteStorage(BaseStorage):
             "UPDATE watched SET tmdb_id = ? WHERE id = ?",
             (tmdb_id, watched_id),
         )
-        await self.db.commit()
+        await self._commit()
         return True
 
+    @_serialized_write
     async def clear_watched(self, user_id: int) -> int:
         """Delete all watched items for a user."""
         cursor = await self.db.execute("DELETE FROM watched WHERE user_id = ?", (user_id,))
-        await self.db.commit()
+        await self._commit()
         return cursor.rowcount or 0
 
     # -------------------------------------------------------------------------
     # Watchlist CRUD Implementation
     # -------------------------------------------------------------------------
 
+    @_serialized_write
     async def add_to_watchlist(
         self,
         user_id: int,
@@ -2427,7 +2895,7 @@ class SQLiteStorage(BaseStorage):
         notes: str | None = None,
     ) -> WatchlistItem:
         """Add item to watchlist."""
-        now = datetime.now(UTC)
+        now = _utcnow()
 
         cursor = await self.db.execute(
             """
@@ -2449,7 +2917,7 @@ class SQLiteStorage(BaseStorage):
                 now.isoformat(),
             ),
         )
-        await self.db.commit()
+        await self._commit()
 
         item_id = cursor.lastrowid
         if item_id is None:
@@ -2493,6 +2961,7 @@ class SQLiteStorage(BaseStorage):
         rows = await cursor.fetchall()
         return [self._row_to_watchlist(row) for row in rows]
 
+    @_serialized_write
     async def remove_from_watchlist(
         self,
         user_id: int,
@@ -2514,7 +2983,7 @@ class SQLiteStorage(BaseStorage):
                 (user_id, kinopoisk_id),
             )
 
-        await self.db.commit()
+        await self._commit()
         return cursor.rowcount > 0 if cursor.rowcount else False
 
     async def is_in_watchlist(
@@ -2540,10 +3009,11 @@ class SQLiteStorage(BaseStorage):
 
         return await cursor.fetchone() is not None
 
+    @_serialized_write
     async def clear_watchlist(self, user_id: int) -> int:
         """Delete all watchlist items for a user."""
         cursor = await self.db.execute("DELETE FROM watchlist WHERE user_id = ?", (user_id,))
-        await self.db.commit()
+        await self._commit()
         return cursor.rowcount or 0
 
     def _row_to_watchlist(self, row: Any) -> WatchlistItem:
@@ -2579,13 +3049,14 @@ class SQLiteStorage(BaseStorage):
             updated_at=datetime.fromisoformat(row["updated_at"]),
         )
 
+    @_serialized_write
     async def update_profile(
         self,
         user_id: int,
         profile_md: str,
     ) -> UserProfile:
         """Update user's markdown profile."""
-        now = datetime.now(UTC)
+        now = _utcnow()
 
         # Try to update first
         cursor = await self.db.execute(
@@ -2606,7 +3077,7 @@ class SQLiteStorage(BaseStorage):
                 (user_id, profile_md, now.isoformat()),
             )
 
-        await self.db.commit()
+        await self._commit()
 
         profile = await self.get_profile(user_id)
         if profile is None:
@@ -2617,6 +3088,7 @@ class SQLiteStorage(BaseStorage):
     # Monitor CRUD Implementation
     # -------------------------------------------------------------------------
 
+    @_serialized_write
     async def create_monitor(
         self,
         user_id: int,
@@ -2631,7 +3103,7 @@ class SQLiteStorage(BaseStorage):
         episode_number: int | None = None,
     ) -> Monitor:
         """Create a release monitor."""
-        now = datetime.now(UTC)
+        now = _utcnow()
 
         cursor = await self.db.execute(
             """
@@ -2654,7 +3126,7 @@ class SQLiteStorage(BaseStorage):
                 now.isoformat(),
             ),
         )
-        await self.db.commit()
+        await self._commit()
 
         monitor_id = cursor.lastrowid
         if monitor_id is None:
@@ -2709,6 +3181,7 @@ class SQLiteStorage(BaseStorage):
         rows = await cursor.fetchall()
         return [self._row_to_monitor(row) for row in rows]
 
+    @_serialized_write
     async def update_monitor_status(
         self,
         monitor_id: int,
@@ -2724,16 +3197,17 @@ class SQLiteStorage(BaseStorage):
             "UPDATE monitors SET status = ?, found_at = ?, found_data = ? WHERE id = ?",
             (status, found_str, found_data_str, monitor_id),
         )
-        await self.db.commit()
+        await self._commit()
 
         cursor = await self.db.execute("SELECT * FROM monitors WHERE id = ?", (monitor_id,))
         row = await cursor.fetchone()
         return self._row_to_monitor(row) if row else None
 
+    @_serialized_write
     async def delete_monitor(self, monitor_id: int) -> bool:
         """Delete a monitor."""
         cursor = await self.db.execute("DELETE FROM monitors WHERE id = ?", (monitor_id,))
-        await self.db.commit()
+        await self._commit()
         return cursor.rowcount > 0 if cursor.rowcount else False
 
     async def get_monitor(self, monitor_id: int) -> Monitor | None:
@@ -2742,14 +3216,15 @@ class SQLiteStorage(BaseStorage):
         row = await cursor.fetchone()
         return self._row_to_monitor(row) if row else None
 
+    @_serialized_write
     async def update_monitor_last_checked(self, monitor_id: int) -> None:
         """Update the last_checked timestamp for a monitor."""
-        now = datetime.now(UTC)
+        now = _utcnow()
         await self.db.execute(
             "UPDATE monitors SET last_checked = ? WHERE id = ?",
             (now.isoformat(), monitor_id),
         )
-        await self.db.commit()
+        await self._commit()
 
     async def get_all_active_monitors(self) -> list[Monitor]:
         """Get all active monitors across all users."""
@@ -2762,7 +3237,7 @@ class SQLiteStorage(BaseStorage):
     async def get_all_users(self, limit: int = 1000) -> list[User]:
         """Get all users (with limit for safety)."""
         cursor = await self.db.execute(
-            "SELECT * FROM users WHERE is_active = 1 ORDER BY id LIMIT ?",
+            f"SELECT {self._USER_COLUMNS} FROM users WHERE is_active = 1 ORDER BY id LIMIT ?",
             (limit,),
         )
         rows = await cursor.fetchall()
@@ -2805,6 +3280,7 @@ class SQLiteStorage(BaseStorage):
     # Crew Stats CRUD Implementation
     # -------------------------------------------------------------------------
 
+    @_serialized_write
     async def update_crew_stat(
         self,
         user_id: int,
@@ -2815,7 +3291,7 @@ class SQLiteStorage(BaseStorage):
         rating: int,
     ) -> CrewStat:
         """Update crew statistics when user watches/rates a film."""
-        now = datetime.now(UTC)
+        now = _utcnow()
 
         # Get existing stat
         cursor = await self.db.execute(
@@ -2875,7 +3351,7 @@ class SQLiteStorage(BaseStorage):
             total_rating = rating
             film_ids = [film_id]
 
-        await self.db.commit()
+        await self._commit()
 
         return CrewStat(
             id=stat_id or 0,
@@ -2929,6 +3405,7 @@ class SQLiteStorage(BaseStorage):
     # Blocklist CRUD Implementation
     # -------------------------------------------------------------------------
 
+    @_serialized_write
     async def add_to_blocklist(
         self,
         user_id: int,
@@ -2938,7 +3415,7 @@ class SQLiteStorage(BaseStorage):
         notes: str | None = None,
     ) -> BlocklistItem:
         """Add item to blocklist."""
-        now = datetime.now(UTC)
+        now = _utcnow()
 
         cursor = await self.db.execute(
             """
@@ -2950,7 +3427,7 @@ class SQLiteStorage(BaseStorage):
             """,
             (user_id, block_type, block_value, block_level, notes, now.isoformat()),
         )
-        await self.db.commit()
+        await self._commit()
 
         item_id = cursor.lastrowid
         if item_id is None:
@@ -2994,6 +3471,7 @@ class SQLiteStorage(BaseStorage):
         rows = await cursor.fetchall()
         return [self._row_to_blocklist(row) for row in rows]
 
+    @_serialized_write
     async def remove_from_blocklist(
         self,
         user_id: int,
@@ -3005,7 +3483,7 @@ class SQLiteStorage(BaseStorage):
             "DELETE FROM blocklist WHERE user_id = ? AND block_type = ? AND block_value = ?",
             (user_id, block_type, block_value),
         )
-        await self.db.commit()
+        await self._commit()
         return cursor.rowcount > 0 if cursor.rowcount else False
 
     async def is_blocked(
@@ -3062,6 +3540,7 @@ class SQLiteStorage(BaseStorage):
         rows = await cursor.fetchall()
         return [self._row_to_core_memory_block(row) for row in rows]
 
+    @_serialized_write
     async def update_core_memory_block(
         self,
         user_id: int,
@@ -3069,7 +3548,7 @@ class SQLiteStorage(BaseStorage):
         content: str,
     ) -> CoreMemoryBlock:
         """Update a core memory block (creates if not exists)."""
-        now = datetime.now(UTC).isoformat()
+        now = _utcnow().isoformat()
         max_chars = CORE_MEMORY_BLOCKS.get(block_name, {}).get("max_chars", 500)
 
         # Truncate content if exceeds max
@@ -3086,7 +3565,7 @@ class SQLiteStorage(BaseStorage):
             """,
             (user_id, block_name, content, max_chars, now),
         )
-        await self.db.commit()
+        await self._commit()
 
         block_id = cursor.lastrowid
         if block_id is None or block_id == 0:
@@ -3106,12 +3585,13 @@ class SQLiteStorage(BaseStorage):
             updated_at=datetime.fromisoformat(now),
         )
 
+    @_serialized_write
     async def initialize_core_memory_blocks(
         self,
         user_id: int,
     ) -> list[CoreMemoryBlock]:
         """Initialize all core memory blocks for a new user."""
-        now = datetime.now(UTC).isoformat()
+        now = _utcnow().isoformat()
         blocks: list[CoreMemoryBlock] = []
 
         for block_name, config in CORE_MEMORY_BLOCKS.items():
@@ -3145,7 +3625,7 @@ class SQLiteStorage(BaseStorage):
                 )
             )
 
-        await self.db.commit()
+        await self._commit()
         logger.info("core_memory_blocks_initialized", user_id=user_id)
         return blocks
 
@@ -3176,12 +3656,13 @@ class SQLiteStorage(BaseStorage):
         row = await cursor.fetchone()
         return self._row_to_session(row) if row else None
 
+    @_serialized_write
     async def create_session(
         self,
         user_id: int,
     ) -> ConversationSession:
         """Create a new conversation session."""
-        now = datetime.now(UTC).isoformat()
+        now = _utcnow().isoformat()
 
         cursor = await self.db.execute(
             """
@@ -3190,7 +3671,7 @@ class SQLiteStorage(BaseStorage):
             """,
             (user_id, now),
         )
-        await self.db.commit()
+        await self._commit()
 
         session_id = cursor.lastrowid
         if session_id is None:
@@ -3205,6 +3686,7 @@ class SQLiteStorage(BaseStorage):
             status="active",
         )
 
+    @_serialized_write
     async def end_session(
         self,
         session_id: int,
@@ -3212,7 +3694,7 @@ class SQLiteStorage(BaseStorage):
         key_learnings: list[str] | None = None,
     ) -> ConversationSession | None:
         """End a session and optionally add summary."""
-        now = datetime.now(UTC).isoformat()
+        now = _utcnow().isoformat()
         learnings_json = json.dumps(key_learnings or [])
 
         await self.db.execute(
@@ -3223,7 +3705,7 @@ class SQLiteStorage(BaseStorage):
             """,
             (now, summary, learnings_json, session_id),
         )
-        await self.db.commit()
+        await self._commit()
 
         cursor = await self.db.execute(
             "SELECT * FROM conversation_sessions WHERE id = ?",
@@ -3232,6 +3714,7 @@ class SQLiteStorage(BaseStorage):
         row = await cursor.fetchone()
         return self._row_to_session(row) if row else None
 
+    @_serialized_write
     async def increment_session_message_count(
         self,
         session_id: int,
@@ -3241,7 +3724,7 @@ class SQLiteStorage(BaseStorage):
             "UPDATE conversation_sessions SET message_count = message_count + 1 WHERE id = ?",
             (session_id,),
         )
-        await self.db.commit()
+        await self._commit()
 
     async def get_recent_sessions(
         self,
@@ -3250,7 +3733,7 @@ class SQLiteStorage(BaseStorage):
         days: int = 30,
     ) -> list[ConversationSession]:
         """Get recent sessions for a user."""
-        cutoff = (datetime.now(UTC) - __import__("datetime").timedelta(days=days)).isoformat()
+        cutoff = (_utcnow() - __import__("datetime").timedelta(days=days)).isoformat()
 
         cursor = await self.db.execute(
             """
@@ -3281,6 +3764,7 @@ class SQLiteStorage(BaseStorage):
     # Memory Notes CRUD Implementation
     # -------------------------------------------------------------------------
 
+    @_serialized_write
     async def create_memory_note(
         self,
         user_id: int,
@@ -3290,7 +3774,7 @@ class SQLiteStorage(BaseStorage):
         confidence: float = 0.5,
     ) -> MemoryNote:
         """Create a new memory note."""
-        now = datetime.now(UTC).isoformat()
+        now = _utcnow().isoformat()
         keywords_json = json.dumps(keywords or [])
 
         cursor = await self.db.execute(
@@ -3301,7 +3785,7 @@ class SQLiteStorage(BaseStorage):
             """,
             (user_id, content, source, keywords_json, confidence, now, now),
         )
-        await self.db.commit()
+        await self._commit()
 
         note_id = cursor.lastrowid
         if note_id is None:
@@ -3379,12 +3863,13 @@ class SQLiteStorage(BaseStorage):
         rows = await cursor.fetchall()
         return [self._row_to_memory_note(row) for row in rows]
 
+    @_serialized_write
     async def update_memory_note_access(
         self,
         note_id: int,
     ) -> None:
         """Update last_accessed and increment access_count."""
-        now = datetime.now(UTC).isoformat()
+        now = _utcnow().isoformat()
         await self.db.execute(
             """
             UPDATE memory_notes
@@ -3393,19 +3878,20 @@ class SQLiteStorage(BaseStorage):
             """,
             (now, note_id),
         )
-        await self.db.commit()
+        await self._commit()
 
+    @_serialized_write
     async def archive_memory_note(
         self,
         note_id: int,
     ) -> bool:
         """Archive a memory note."""
-        now = datetime.now(UTC).isoformat()
+        now = _utcnow().isoformat()
         cursor = await self.db.execute(
             "UPDATE memory_notes SET archived_at = ? WHERE id = ?",
             (now, note_id),
         )
-        await self.db.commit()
+        await self._commit()
         return cursor.rowcount > 0 if cursor.rowcount else False
 
     async def get_notes_for_archival(
@@ -3415,7 +3901,7 @@ class SQLiteStorage(BaseStorage):
         min_access_count: int = 3,
     ) -> list[MemoryNote]:
         """Get notes that should be considered for archival."""
-        cutoff = (datetime.now(UTC) - __import__("datetime").timedelta(days=age_days)).isoformat()
+        cutoff = (_utcnow() - __import__("datetime").timedelta(days=age_days)).isoformat()
 
         cursor = await self.db.execute(
             """
@@ -3450,6 +3936,7 @@ class SQLiteStorage(BaseStorage):
     # Downloads CRUD Implementation
     # -------------------------------------------------------------------------
 
+    @_serialized_write
     async def add_download(
         self,
         user_id: int,
@@ -3463,7 +3950,7 @@ class SQLiteStorage(BaseStorage):
         magnet_hash: str | None = None,
     ) -> Download:
         """Record a download event."""
-        now = datetime.now(UTC).isoformat()
+        now = _utcnow().isoformat()
 
         cursor = await self.db.execute(
             """
@@ -3484,7 +3971,7 @@ class SQLiteStorage(BaseStorage):
                 now,
             ),
         )
-        await self.db.commit()
+        await self._commit()
 
         download_id = cursor.lastrowid
         if download_id is None:
@@ -3531,7 +4018,7 @@ class SQLiteStorage(BaseStorage):
         days: int = 3,
     ) -> list[Download]:
         """Get downloads that need follow-up (older than N days, not followed up)."""
-        cutoff = (datetime.now(UTC) - __import__("datetime").timedelta(days=days)).isoformat()
+        cutoff = (_utcnow() - __import__("datetime").timedelta(days=days)).isoformat()
 
         cursor = await self.db.execute(
             """
@@ -3545,6 +4032,7 @@ class SQLiteStorage(BaseStorage):
         rows = await cursor.fetchall()
         return [self._row_to_download(row) for row in rows]
 
+    @_serialized_write
     async def mark_followup_sent(
         self,
         download_id: int,
@@ -3554,9 +4042,10 @@ class SQLiteStorage(BaseStorage):
             "UPDATE downloads SET followed_up = 1 WHERE id = ?",
             (download_id,),
         )
-        await self.db.commit()
+        await self._commit()
         return cursor.rowcount > 0 if cursor.rowcount else False
 
+    @_serialized_write
     async def mark_followup_answered(
         self,
         download_id: int,
@@ -3573,16 +4062,17 @@ class SQLiteStorage(BaseStorage):
                 "UPDATE downloads SET followed_up = 2 WHERE id = ?",
                 (download_id,),
             )
-        await self.db.commit()
+        await self._commit()
         return cursor.rowcount > 0 if cursor.rowcount else False
 
+    @_serialized_write
     async def reset_followup_status(self, download_id: int) -> bool:
         """Reset followup status to pending (0) for a download."""
         cursor = await self.db.execute(
             "UPDATE downloads SET followed_up = 0 WHERE id = ?",
             (download_id,),
         )
-        await self.db.commit()
+        await self._commit()
         return cursor.rowcount > 0 if cursor.rowcount else False
 
     async def get_download(
@@ -3599,7 +4089,7 @@ class SQLiteStorage(BaseStorage):
 
     async def get_recent_unreviewed_downloads(self, user_id: int, days: int = 14) -> list[Download]:
         """Get recent downloads that haven't been reviewed (followed_up < 2)."""
-        cutoff = (datetime.now(UTC) - timedelta(days=days)).isoformat()
+        cutoff = (_utcnow() - timedelta(days=days)).isoformat()
         cursor = await self.db.execute(
             """SELECT * FROM downloads
                WHERE user_id = ? AND followed_up < 2 AND downloaded_at >= ?
@@ -3609,6 +4099,7 @@ class SQLiteStorage(BaseStorage):
         rows = await cursor.fetchall()
         return [self._row_to_download(row) for row in rows]
 
+    @_serialized_write
     async def add_digest_history(
         self,
         user_id: int,
@@ -3617,13 +4108,13 @@ class SQLiteStorage(BaseStorage):
         topics_summary: str | None = None,
     ) -> DigestHistory:
         """Record a digest delivery."""
-        now = datetime.now(UTC).isoformat()
+        now = _utcnow().isoformat()
         cursor = await self.db.execute(
             """INSERT INTO digest_history (user_id, digest_type, content_hash, topics_summary, sent_at)
                VALUES (?, ?, ?, ?, ?)""",
             (user_id, digest_type, content_hash, topics_summary, now),
         )
-        await self.db.commit()
+        await self._commit()
         return DigestHistory(
             id=cursor.lastrowid,
             user_id=user_id,
@@ -3637,7 +4128,7 @@ class SQLiteStorage(BaseStorage):
         self, user_id: int, days: int = 3, digest_type: str = "daily"
     ) -> list[str]:
         """Get topics from recent daily digests to avoid repetition."""
-        cutoff = (datetime.now(UTC) - timedelta(days=days)).isoformat()
+        cutoff = (_utcnow() - timedelta(days=days)).isoformat()
         cursor = await self.db.execute(
             """SELECT topics_summary FROM digest_history
                WHERE user_id = ? AND digest_type = ? AND sent_at >= ? AND topics_summary IS NOT NULL
@@ -3682,6 +4173,7 @@ class SQLiteStorage(BaseStorage):
     # Pending Pushes CRUD Implementation
     # -------------------------------------------------------------------------
 
+    @_serialized_write
     async def create_pending_push(
         self,
         user_id: int,
@@ -3690,7 +4182,7 @@ class SQLiteStorage(BaseStorage):
         content: dict[str, Any],
     ) -> PendingPush:
         """Create a pending push notification."""
-        now = datetime.now(UTC).isoformat()
+        now = _utcnow().isoformat()
 
         cursor = await self.db.execute(
             """
@@ -3699,7 +4191,7 @@ class SQLiteStorage(BaseStorage):
             """,
             (user_id, push_type, priority, json.dumps(content), now),
         )
-        await self.db.commit()
+        await self._commit()
 
         push_id = cursor.lastrowid
         if push_id is None:
@@ -3756,17 +4248,18 @@ class SQLiteStorage(BaseStorage):
         row = await cursor.fetchone()
         return self._row_to_pending_push(row) if row else None
 
+    @_serialized_write
     async def mark_push_sent(
         self,
         push_id: int,
     ) -> bool:
         """Mark a push as sent."""
-        now = datetime.now(UTC).isoformat()
+        now = _utcnow().isoformat()
         cursor = await self.db.execute(
             "UPDATE pending_pushes SET sent_at = ? WHERE id = ?",
             (now, push_id),
         )
-        await self.db.commit()
+        await self._commit()
         return cursor.rowcount > 0 if cursor.rowcount else False
 
     async def get_last_push_time(
@@ -3786,17 +4279,18 @@ class SQLiteStorage(BaseStorage):
             return datetime.fromisoformat(row["last_sent"])
         return None
 
+    @_serialized_write
     async def delete_old_pushes(
         self,
         days: int = 7,
     ) -> int:
         """Delete sent pushes older than N days. Returns count deleted."""
-        cutoff = (datetime.now(UTC) - __import__("datetime").timedelta(days=days)).isoformat()
+        cutoff = (_utcnow() - __import__("datetime").timedelta(days=days)).isoformat()
         cursor = await self.db.execute(
             "DELETE FROM pending_pushes WHERE sent_at IS NOT NULL AND sent_at < ?",
             (cutoff,),
         )
-        await self.db.commit()
+        await self._commit()
         return cursor.rowcount if cursor.rowcount else 0
 
     def _row_to_pending_push(self, row: Any) -> PendingPush:
@@ -3817,6 +4311,7 @@ class SQLiteStorage(BaseStorage):
     # Synced Torrents CRUD
     # -------------------------------------------------------------------------
 
+    @_serialized_write
     async def track_torrent(
         self,
         user_id: int,
@@ -3826,7 +4321,7 @@ class SQLiteStorage(BaseStorage):
         size_bytes: int | None = None,
     ) -> SyncedTorrent:
         """Track a torrent sent to seedbox."""
-        now = datetime.now(UTC).isoformat()
+        now = _utcnow().isoformat()
         cursor = await self.db.execute(
             """
             INSERT INTO synced_torrents (user_id, torrent_hash, torrent_name, seedbox_path, size_bytes, created_at)
@@ -3841,7 +4336,7 @@ class SQLiteStorage(BaseStorage):
             (user_id, torrent_hash, torrent_name, seedbox_path, size_bytes, now),
         )
         row = await cursor.fetchone()
-        await self.db.commit()
+        await self._commit()
 
         if row:
             return self._row_to_synced_torrent(row)
@@ -3854,6 +4349,7 @@ class SQLiteStorage(BaseStorage):
         row = await cursor.fetchone()
         return self._row_to_synced_torrent(row)
 
+    @_serialized_write
     async def update_torrent_status(
         self,
         torrent_hash: str,
@@ -3870,7 +4366,7 @@ class SQLiteStorage(BaseStorage):
             """,
             (status, synced_at_str, local_path, torrent_hash),
         )
-        await self.db.commit()
+        await self._commit()
         return cursor.rowcount > 0 if cursor.rowcount else False
 
     async def get_downloading_torrents(self) -> list[SyncedTorrent]:
@@ -3913,8 +4409,8 @@ class SQLiteStorage(BaseStorage):
     ) -> User | None:
         """Get user who owns a torrent (for notifications)."""
         cursor = await self.db.execute(
-            """
-            SELECT u.* FROM users u
+            f"""
+            SELECT {self._USER_COLUMNS_U} FROM users u
             JOIN synced_torrents st ON u.id = st.user_id
             WHERE st.torrent_hash = ?
             """,
@@ -3933,8 +4429,8 @@ class SQLiteStorage(BaseStorage):
         words = re.split(r"[\s._]+", name.strip())
         pattern = "%" + "%".join(w for w in words if w) + "%"
         cursor = await self.db.execute(
-            """
-            SELECT u.* FROM users u
+            f"""
+            SELECT {self._USER_COLUMNS_U} FROM users u
             JOIN synced_torrents st ON u.id = st.user_id
             WHERE st.torrent_name LIKE ? COLLATE NOCASE
             AND st.status IN ('seeding', 'downloading')
@@ -3946,17 +4442,18 @@ class SQLiteStorage(BaseStorage):
         row = await cursor.fetchone()
         return self._row_to_user(row) if row else None
 
+    @_serialized_write
     async def mark_torrent_deleted(
         self,
         torrent_hash: str,
     ) -> bool:
         """Mark a torrent as deleted from seedbox."""
-        now = datetime.now(UTC).isoformat()
+        now = _utcnow().isoformat()
         cursor = await self.db.execute(
             "UPDATE synced_torrents SET status = 'deleted', deleted_from_seedbox_at = ? WHERE torrent_hash = ?",
             (now, torrent_hash),
         )
-        await self.db.commit()
+        await self._commit()
         return cursor.rowcount > 0 if cursor.rowcount else False
 
     def _row_to_synced_torrent(self, row: Any) -> SyncedTorrent:
@@ -3981,13 +4478,14 @@ class SQLiteStorage(BaseStorage):
     # Library Index
     # -------------------------------------------------------------------------
 
+    @_serialized_write
     async def save_library_index(
         self,
         category: str,
         items_json: str,
     ) -> None:
         """Save (upsert) library index for a category."""
-        now = datetime.now(UTC).isoformat()
+        now = _utcnow().isoformat()
         await self.db.execute(
             """
             INSERT INTO library_index (category, items_json, updated_at)
@@ -3996,7 +4494,7 @@ class SQLiteStorage(BaseStorage):
             """,
             (category, items_json, now),
         )
-        await self.db.commit()
+        await self._commit()
 
     async def get_library_index(
         self,
@@ -4023,14 +4521,16 @@ class PostgresStorage(BaseStorage):
         self,
         database_url: str,
         encryption_key: str | bytes | None = None,
+        cipher: Cipher | None = None,
     ):
         """Initialize Postgres storage.
 
         Args:
             database_url: PostgreSQL connection URL
             encryption_key: Optional Fernet key for encrypting credentials
+            cipher: Optional Cipher used instead of one built from encryption_key
         """
-        super().__init__(encryption_key)
+        super().__init__(encryption_key, cipher)
         self._database_url = database_url
         self._pool: Any = None
 
@@ -4367,6 +4867,21 @@ class PostgresStorage(BaseStorage):
             """
             ALTER TABLE digest_history ADD COLUMN IF NOT EXISTS topics_summary TEXT;
             """,
+            # Migration 26: Per-user watch history index matching get_watched's
+            # ORDER BY; drops indexes already covered by users.telegram_id UNIQUE
+            # and by the new index's user_id prefix
+            """
+            CREATE INDEX IF NOT EXISTS idx_watched_user_time ON watched(user_id, watched_at DESC);
+            DROP INDEX IF EXISTS idx_watched_user_id;
+            DROP INDEX IF EXISTS idx_users_telegram_id;
+            """,
+            # Migration 27: Per-user indexes for is_watched lookups; drops the
+            # credentials user_id index already covered by its UNIQUE constraint
+            """
+            CREATE INDEX IF NOT EXISTS idx_watched_user_tmdb ON watched(user_id, tmdb_id);
+            CREATE INDEX IF NOT EXISTS idx_watched_user_kp ON watched(user_id, kinopoisk_id);
+            DROP INDEX IF EXISTS idx_credentials_user_id;
+            """,
         ]
 
         async with self.pool.acquire() as conn:
@@ -4438,6 +4953,45 @@ class PostgresStorage(BaseStorage):
         logger.info("user_created", user_id=row["id"], telegram_id=telegram_id)
         return self._row_to_user(row)
 
+    async def create_users_bulk(self, rows: list[dict[str, Any]]) -> list[User]:
+        """Create many users with default preferences in one transaction."""
+        if not rows:
+            return []
+
+        telegram_ids = [row["telegram_id"] for row in rows]
+
+        async with self.pool.acquire() as conn, conn.transaction():
+            await conn.executemany(
+                """
+                INSERT INTO users (telegram_id, username, first_name, last_name, language_code)
+                VALUES ($1, $2, $3, $4, $5)
+                """,
+                [
+                    (
+                        row["telegram_id"],
+                        row.get("username"),
+                        row.get("first_name"),
+                        row.get("last_name"),
+                        row.get("language_code", "ru"),
+                    )
+                    for row in rows
+                ],
+            )
+            user_rows = await conn.fetch(
+                "SELECT * FROM users WHERE telegram_id = ANY($1::bigint[])",
+                telegram_ids,
+            )
+
+            # Create default preferences
+            await conn.executemany(
+                "INSERT INTO preferences (user_id) VALUES ($1)",
+                [(user_row["id"],) for user_row in user_rows],
+            )
+
+        by_telegram_id = {user.telegram_id: user for user in map(self._row_to_user, user_rows)}
+        logger.info("users_created", count=len(rows))
+        return [by_telegram_id[telegram_id] for telegram_id in telegram_ids]
+
     async def get_user(self, user_id: int) -> User | None:
         """Get user by internal ID."""
         async with self.pool.acquire() as conn:
@@ -4589,6 +5143,40 @@ class PostgresStorage(BaseStorage):
             updated_at=row["updated_at"],
         )
 
+    async def store_credentials_bulk(
+        self,
+        user_id: int,
+        values: dict[CredentialType, str],
+        expires_at: datetime | None = None,
+    ) -> int:
+        """Store several encrypted credentials for one user in one transaction."""
+        if self._encryption is None:
+            raise RuntimeError("Encryption key not configured")
+        if not values:
+            return 0
+
+        # Encrypt everything up front so the DB sees a single batch
+        rows = [
+            (user_id, credential_type.value, self._encryption.encrypt(value), expires_at)
+            for credential_type, value in values.items()
+        ]
+
+        async with self.pool.acquire() as conn, conn.transaction():
+            await conn.executemany(
+                """
+                INSERT INTO credentials (user_id, credential_type, encrypted_value, expires_at)
+                VALUES ($1, $2, $3, $4)
+                ON CONFLICT (user_id, credential_type) DO UPDATE SET
+                    encrypted_value = EXCLUDED.encrypted_value,
+                    expires_at = EXCLUDED.expires_at,
+                    updated_at = NOW()
+                """,
+                rows,
+            )
+
+        logger.info("credentials_stored", user_id=user_id, count=len(rows))
+        return len(rows)
+
     async def get_credential(
         self,
         user_id: int,
@@ -4600,15 +5188,19 @@ class PostgresStorage(BaseStorage):
 
         async with self.pool.acquire() as conn:
             row = await conn.fetchrow(
-                "SELECT encrypted_value, expires_at FROM credentials WHERE user_id = $1 AND credential_type = $2",
+                """
+                SELECT encrypted_value, expires_at IS NULL OR expires_at > $3 AS is_live
+                FROM credentials WHERE user_id = $1 AND credential_type = $2
+                """,
                 user_id,
                 credential_type.value,
+                _utcnow(),
             )
 
         if row is None:
             return None
 
-        if row["expires_at"] and row["expires_at"] < datetime.now(UTC):
+        if not row["is_live"]:
             logger.warning(
                 "credential_expired",
                 user_id=user_id,
@@ -4697,11 +5289,11 @@ class PostgresStorage(BaseStorage):
             param_idx += 1
         if preferred_genres is not None:
             updates.append(f"preferred_genres = ${param_idx}")
-            params.append(json.dumps(preferred_genres))
+            params.append(_dumps_json_list(preferred_genres))
             param_idx += 1
         if excluded_genres is not None:
             updates.append(f"excluded_genres = ${param_idx}")
-            params.append(json.dumps(excluded_genres))
+            params.append(_dumps_json_list(excluded_genres))
             param_idx += 1
         if auto_download is not None:
             updates.append(f"auto_download = ${param_idx}")
@@ -4754,9 +5346,9 @@ class PostgresStorage(BaseStorage):
 
         # Handle both JSON string and already parsed list
         if isinstance(preferred, str):
-            preferred = json.loads(preferred)
+            preferred = _loads_json_list(preferred)
         if isinstance(excluded, str):
-            excluded = json.loads(excluded)
+            excluded = _loads_json_list(excluded)
 
         return Preference(
             id=row["id"],
@@ -4796,7 +5388,7 @@ class PostgresStorage(BaseStorage):
         watched_at: datetime | None = None,
     ) -> WatchedItem:
         """Add item to watch history."""
-        watched_at = watched_at or datetime.now(UTC)
+        watched_at = watched_at or _utcnow()
 
         async with self.pool.acquire() as conn:
             row = await conn.fetchrow(
@@ -4823,6 +5415,42 @@ class PostgresStorage(BaseStorage):
         logger.info("watched_added", user_id=user_id, media_type=media_type, title=title)
         return self._row_to_watched(row)
 
+    async def add_watched_bulk(self, user_id: int, items: list[dict[str, Any]]) -> int:
+        """Add many items to a user's watch history in one transaction."""
+        if not items:
+            return 0
+
+        now = _utcnow()
+
+        async with self.pool.acquire() as conn, conn.transaction():
+            await conn.executemany(
+                """
+                INSERT INTO watched
+                    (user_id, media_type, tmdb_id, kinopoisk_id, title, year,
+                     season, episode, rating, review, watched_at)
+                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
+                """,
+                [
+                    (
+                        user_id,
+                        item["media_type"],
+                        item.get("tmdb_id"),
+                        item.get("kinopoisk_id"),
+                        item["title"],
+                        item.get("year"),
+                        item.get("season"),
+                        item.get("episode"),
+                        item.get("rating"),
+                        item.get("review"),
+                        item.get("watched_at") or now,
+                    )
+                    for item in items
+                ],
+            )
+
+        logger.info("watched_added_bulk", user_id=user_id, count=len(items))
+        return len(items)
+
     async def get_watched(
         self,
         user_id: int,
@@ -4897,6 +5525,12 @@ class PostgresStorage(BaseStorage):
             result = await conn.execute("DELETE FROM watched WHERE id = $1", item_id)
         return result == "DELETE 1"
 
+    async def exists_watched(self, item_id: int) -> bool:
+        """Check if a watch history item exists, without loading it."""
+        async with self.pool.acquire() as conn:
+            row = await conn.fetchrow("SELECT 1 FROM watched WHERE id = $1 LIMIT 1", item_id)
+        return row is not None
+
     async def update_watched_rating(
         self,
         user_id: int,
@@ -6501,6 +7135,7 @@ def get_storage_backend(
     database_url: str | None = None,
     db_path: str | Path = "data/users.db",
     encryption_key: str | bytes | None = None,
+    cipher: Cipher | None = None,
 ) -> BaseStorage:
     """Get the appropriate storage backend.
 
@@ -6508,15 +7143,16 @@ def get_storage_backend(
         database_url: PostgreSQL connection URL (if set, uses Postgres)
         db_path: Path to SQLite database (fallback if no database_url)
         encryption_key: Fernet key for encrypting credentials
+        cipher: Optional Cipher used instead of one built from encryption_key
 
     Returns:
         Either PostgresStorage or SQLiteStorage instance
     """
     if database_url:
         logger.info("using_postgres_storage")
-        return PostgresStorage(database_url, encryption_key)
+        return PostgresStorage(database_url, encryption_key, cipher)
     logger.info("using_sqlite_storage", db_path=str(db_path))
-    return SQLiteStorage(db_path, encryption_key)
+    return SQLiteStorage(db_path, encryption_key, cipher)
 
 
 @asynccontextmanager
@@ -6542,7 +7178,9 @@ async def get_user_storage(
     if settings.database_url:
         database_url = settings.database_url.get_secret_value()
 
-    storage = get_storage_backend(database_url, db_path, encryption_key)
+    storage = get_storage_backend(
+        database_url, db_path, encryption_key, _settings_cipher(encryption_key)
+    )
     async with storage:
         yield storage
 
@@ -6575,6 +7213,7 @@ async def get_storage(
         database_url,
         "data/users.db",
         encryption_key,
+        _settings_cipher(encryption_key),
     )
     async with storage:
         yield storage
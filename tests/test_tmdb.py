@@ -1,5 +1,6 @@
 """Tests for TMDB (The Movie Database) API client."""
 
+import copy
 import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -326,6 +327,10 @@ class TestPerson:
         assert person.get_profile_url() is None
 
 
+# Built once: constructing fifteen validated Person models per run is wasted work
+_TOP_CAST_FIXTURE = [Person(id=i, name=f"Actor {i}") for i in range(15)]
+
+
 class TestCredits:
     """Tests for Credits model."""
 
@@ -367,10 +372,7 @@ class TestCredits:
 
     def test_get_top_cast(self):
         """Test getting top cast members."""
-        credits = Credits(
-            cast=[Person(id=i, name=f"Actor {i}") for i in range(15)],
-            crew=[],
-        )
+        credits = Credits(cast=_TOP_CAST_FIXTURE, crew=[])
         top_cast = credits.get_top_cast(limit=5)
         assert len(top_cast) == 5
         assert top_cast[0].name == "Actor 0"
@@ -498,6 +500,24 @@ class TestSearchResult:
 # =============================================================================
 
 
+class FakeClock:
+    """Controllable replacement for time.time()."""
+
+    def __init__(self, start: float = 1000.0):
+        self.t = start
+
+    def __call__(self) -> float:
+        return self.t
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Patch the clock used by SimpleCache with a manually advanced one."""
+    fake = FakeClock()
+    monkeypatch.setattr(time, "time", fake)
+    return fake
+
+
 class TestSimpleCache:
     """Tests for SimpleCache."""
 
@@ -512,14 +532,14 @@ class TestSimpleCache:
         cache = SimpleCache(ttl=60)
         assert cache.get("nonexistent") is None
 
-    def test_cache_expiry(self):
+    def test_cache_expiry(self, clock):
         """Test cache expiration."""
         cache = SimpleCache(ttl=1)
         cache.set("key1", "value1")
         assert cache.get("key1") == "value1"
 
         # Simulate time passing
-        cache._cache["key1"] = ("value1", time.time() - 2)
+        clock.t += 2
         assert cache.get("key1") is None
 
     def test_cache_clear(self):
@@ -531,14 +551,14 @@ class TestSimpleCache:
         assert cache.get("key1") is None
         assert cache.get("key2") is None
 
-    def test_cache_cleanup_expired(self):
+    def test_cache_cleanup_expired(self, clock):
         """Test cleanup of expired entries."""
         cache = SimpleCache(ttl=1)
         cache.set("key1", "value1")
-        cache.set("key2", "value2")
 
         # Expire one entry
-        cache._cache["key1"] = ("value1", time.time() - 2)
+        clock.t += 2
+        cache.set("key2", "value2")
 
         removed = cache.cleanup_expired()
         assert removed == 1
@@ -551,6 +571,176 @@ class TestSimpleCache:
 # =============================================================================
 
 
+class FakeResponse:
+    """Minimal stand-in for httpx.Response.
+
+    TMDBClient only reads status_code, text, headers and json(), so a plain
+    slotted object is enough and far cheaper than MagicMock(spec=httpx.Response).
+    """
+
+    __slots__ = ("_data", "headers", "status_code", "text")
+
+    def __init__(
+        self,
+        data: dict | None = None,
+        status_code: int = 200,
+        text: str | None = None,
+        headers: dict[str, str] | None = None,
+    ):
+        self._data = data
+        self.status_code = status_code
+        self.text = str(data) if text is None else text
+        self.headers = headers if headers is not None else {}
+
+    def json(self) -> dict | None:
+        # Fresh copy per call, like a real response, so the client cannot
+        # mutate the shared SAMPLE_* payloads.
+        return copy.deepcopy(self._data)
+
+
+@pytest.fixture
+def tmdb_client() -> TMDBClient:
+    """Create a TMDB client with a stubbed HTTP transport.
+
+    The stub is assigned directly instead of entering the context manager,
+    so no real httpx.AsyncClient is built for each test.
+    """
+    client = TMDBClient(api_key="test_key", cache_ttl=3600)
+    client._client = MagicMock(spec=httpx.AsyncClient)
+    client._client.get = AsyncMock()
+    yield client
+    client.clear_cache()
+
+
+def _check_search_movie(results):
+    assert len(results) == 2
+    assert results[0].id == 27205
+    assert results[0].title == "Inception"
+    assert results[0].media_type == MediaType.MOVIE
+    assert results[0].vote_average == 8.4
+
+
+def _check_search_tv(results):
+    assert len(results) == 1
+    assert results[0].id == 1396
+    assert results[0].title == "Breaking Bad"
+    assert results[0].media_type == MediaType.TV
+
+
+def _check_search_multi(results):
+    # Should filter out person results
+    assert len(results) == 2
+    assert results[0].media_type == MediaType.MOVIE
+    assert results[1].media_type == MediaType.TV
+
+
+def _check_movie(movie):
+    assert movie.id == 27205
+    assert movie.title == "Inception"
+    assert movie.runtime == 148
+    assert len(movie.genres) == 2
+    assert movie.genres[0].name == "Action"
+    assert movie.imdb_id == "tt1375666"
+
+
+def _check_tv_show(tv):
+    assert tv.id == 1396
+    assert tv.name == "Breaking Bad"
+    assert tv.number_of_seasons == 5
+    assert tv.number_of_episodes == 62
+    assert not tv.in_production
+
+
+def _check_person(person):
+    assert person["id"] == 137427
+    assert person["name"] == "Denis Villeneuve"
+    assert person["known_for_department"] == "Directing"
+    assert person["birthday"] == "1967-10-03"
+    assert person["profile_path"] == "/zdDx9Xs93UIrJFWYApYR28J8M6b.jpg"
+    assert "biography" in person
+
+
+def _check_movie_credits(credits):
+    assert len(credits.cast) == 2
+    assert credits.cast[0].name == "Leonardo DiCaprio"
+    assert credits.cast[0].character == "Cobb"
+    assert len(credits.crew) == 2
+    directors = credits.get_directors()
+    assert len(directors) == 1
+    assert directors[0].name == "Christopher Nolan"
+
+
+def _check_movie_recommendations(results):
+    assert len(results) == 2
+    assert results[0].id == 157336
+    assert results[0].title == "Interstellar"
+    assert results[0].media_type == MediaType.MOVIE
+
+
+def _check_credits(credits):
+    assert len(credits.cast) == 2
+
+
+def _check_recommendations(results):
+    assert len(results) == 2
+
+
+API_CALL_CASES = [
+    pytest.param(
+        "search_movie",
+        ("Inception",),
+        SAMPLE_MOVIE_SEARCH_RESPONSE,
+        _check_search_movie,
+        id="search_movie",
+    ),
+    pytest.param(
+        "search_tv",
+        ("Breaking Bad",),
+        SAMPLE_TV_SEARCH_RESPONSE,
+        _check_search_tv,
+        id="search_tv",
+    ),
+    pytest.param(
+        "search_multi",
+        ("test",),
+        SAMPLE_MULTI_SEARCH_RESPONSE,
+        _check_search_multi,
+        id="search_multi",
+    ),
+    pytest.param("get_movie", (27205,), SAMPLE_MOVIE_DETAILS, _check_movie, id="get_movie"),
+    pytest.param("get_tv_show", (1396,), SAMPLE_TV_DETAILS, _check_tv_show, id="get_tv_show"),
+    pytest.param("get_person", (137427,), SAMPLE_PERSON_DETAILS, _check_person, id="get_person"),
+    pytest.param(
+        "get_movie_credits",
+        (27205,),
+        SAMPLE_CREDITS,
+        _check_movie_credits,
+        id="get_movie_credits",
+    ),
+    pytest.param(
+        "get_credits",
+        (27205, MediaType.MOVIE),
+        SAMPLE_CREDITS,
+        _check_credits,
+        id="get_credits_movie",
+    ),
+    pytest.param(
+        "get_movie_recommendations",
+        (27205,),
+        SAMPLE_RECOMMENDATIONS,
+        _check_movie_recommendations,
+        id="get_movie_recommendations",
+    ),
+    pytest.param(
+        "get_recommendations",
+        (27205, MediaType.MOVIE),
+        SAMPLE_RECOMMENDATIONS,
+        _check_recommendations,
+        id="get_recommendations_movie",
+    ),
+]
+
+
 class TestTMDBClient:
     """Tests for TMDBClient."""
 
@@ -559,16 +749,10 @@ class TestTMDBClient:
         """Create a mock HTTP response."""
 
         def _create_response(data: dict, status_code: int = 200):
-            response = MagicMock(spec=httpx.Response)
-            response.status_code = status_code
-            response.json.return_value = data
-            response.text = str(data)
-            response.headers = {}
-            return response
+            return FakeResponse(data, status_code)
 
         return _create_response
 
-    @pytest.mark.asyncio
     async def test_client_context_manager(self):
         """Test client as context manager."""
         with patch("src.media.tmdb.settings") as mock_settings:
@@ -579,7 +763,6 @@ class TestTMDBClient:
                 assert client._client is not None
             assert client._client is None
 
-    @pytest.mark.asyncio
     async def test_client_not_in_context(self):
         """Test client raises error when not in context manager."""
         with patch("src.media.tmdb.settings") as mock_settings:
@@ -590,280 +773,59 @@ class TestTMDBClient:
             with pytest.raises(RuntimeError, match="must be used as async context"):
                 _ = client.client
 
-    @pytest.mark.asyncio
-    async def test_search_movie(self, mock_response):
-        """Test movie search."""
-        with patch("src.media.tmdb.settings") as mock_settings:
-            mock_settings.tmdb_api_key.get_secret_value.return_value = "test_key"
-            mock_settings.cache_ttl = 3600
-
-            async with TMDBClient() as client:
-                client._client = MagicMock(spec=httpx.AsyncClient)
-                client._client.get = AsyncMock(
-                    return_value=mock_response(SAMPLE_MOVIE_SEARCH_RESPONSE)
-                )
+    @pytest.mark.parametrize(("method", "args", "sample", "check"), API_CALL_CASES)
+    async def test_api_call(self, tmdb_client, mock_response, method, args, sample, check):
+        """Test that each API method parses its sample response."""
+        tmdb_client._client.get.return_value = mock_response(sample)
 
-                results = await client.search_movie("Inception")
+        result = await getattr(tmdb_client, method)(*args)
 
-                assert len(results) == 2
-                assert results[0].id == 27205
-                assert results[0].title == "Inception"
-                assert results[0].media_type == MediaType.MOVIE
-                assert results[0].vote_average == 8.4
+        check(result)
 
-    @pytest.mark.asyncio
-    async def test_search_movie_with_year(self, mock_response):
+    async def test_search_movie_with_year(self, tmdb_client, mock_response):
         """Test movie search with year filter."""
-        with patch("src.media.tmdb.settings") as mock_settings:
-            mock_settings.tmdb_api_key.get_secret_value.return_value = "test_key"
-            mock_settings.cache_ttl = 3600
-
-            async with TMDBClient() as client:
-                client._client = MagicMock(spec=httpx.AsyncClient)
-                client._client.get = AsyncMock(
-                    return_value=mock_response(SAMPLE_MOVIE_SEARCH_RESPONSE)
-                )
-
-                results = await client.search_movie("Inception", year=2010)
-
-                assert len(results) == 2
-                # Verify year was passed in params
-                call_args = client._client.get.call_args
-                assert "year" in call_args.kwargs["params"]
-                assert call_args.kwargs["params"]["year"] == 2010
-
-    @pytest.mark.asyncio
-    async def test_search_tv(self, mock_response):
-        """Test TV show search."""
-        with patch("src.media.tmdb.settings") as mock_settings:
-            mock_settings.tmdb_api_key.get_secret_value.return_value = "test_key"
-            mock_settings.cache_ttl = 3600
-
-            async with TMDBClient() as client:
-                client._client = MagicMock(spec=httpx.AsyncClient)
-                client._client.get = AsyncMock(
-                    return_value=mock_response(SAMPLE_TV_SEARCH_RESPONSE)
-                )
-
-                results = await client.search_tv("Breaking Bad")
-
-                assert len(results) == 1
-                assert results[0].id == 1396
-                assert results[0].title == "Breaking Bad"
-                assert results[0].media_type == MediaType.TV
-
-    @pytest.mark.asyncio
-    async def test_search_multi(self, mock_response):
-        """Test multi search (movies and TV)."""
-        with patch("src.media.tmdb.settings") as mock_settings:
-            mock_settings.tmdb_api_key.get_secret_value.return_value = "test_key"
-            mock_settings.cache_ttl = 3600
-
-            async with TMDBClient() as client:
-                client._client = MagicMock(spec=httpx.AsyncClient)
-                client._client.get = AsyncMock(
-                    return_value=mock_response(SAMPLE_MULTI_SEARCH_RESPONSE)
-                )
-
-                results = await client.search_multi("test")
-
-                # Should filter out person results
-                assert len(results) == 2
-                assert results[0].media_type == MediaType.MOVIE
-                assert results[1].media_type == MediaType.TV
-
-    @pytest.mark.asyncio
-    async def test_get_movie(self, mock_response):
-        """Test getting movie details."""
-        with patch("src.media.tmdb.settings") as mock_settings:
-            mock_settings.tmdb_api_key.get_secret_value.return_value = "test_key"
-            mock_settings.cache_ttl = 3600
-
-            async with TMDBClient() as client:
-                client._client = MagicMock(spec=httpx.AsyncClient)
-                client._client.get = AsyncMock(return_value=mock_response(SAMPLE_MOVIE_DETAILS))
-
-                movie = await client.get_movie(27205)
-
-                assert movie.id == 27205
-                assert movie.title == "Inception"
-                assert movie.runtime == 148
-                assert len(movie.genres) == 2
-                assert movie.genres[0].name == "Action"
-                assert movie.imdb_id == "tt1375666"
-
-    @pytest.mark.asyncio
-    async def test_get_tv_show(self, mock_response):
-        """Test getting TV show details."""
-        with patch("src.media.tmdb.settings") as mock_settings:
-            mock_settings.tmdb_api_key.get_secret_value.return_value = "test_key"
-            mock_settings.cache_ttl = 3600
-
-            async with TMDBClient() as client:
-                client._client = MagicMock(spec=httpx.AsyncClient)
-                client._client.get = AsyncMock(return_value=mock_response(SAMPLE_TV_DETAILS))
-
-                tv = await client.get_tv_show(1396)
-
-                assert tv.id == 1396
-                assert tv.name == "Breaking Bad"
-                assert tv.number_of_seasons == 5
-                assert tv.number_of_episodes == 62
-                assert not tv.in_production
-
-    @pytest.mark.asyncio
-    async def test_get_person(self, mock_response):
-        """Test getting person details."""
-        with patch("src.media.tmdb.settings") as mock_settings:
-            mock_settings.tmdb_api_key.get_secret_value.return_value = "test_key"
-            mock_settings.cache_ttl = 3600
-
-            async with TMDBClient() as client:
-                client._client = MagicMock(spec=httpx.AsyncClient)
-                client._client.get = AsyncMock(return_value=mock_response(SAMPLE_PERSON_DETAILS))
-
-                person = await client.get_person(137427)
-
-                assert person["id"] == 137427
-                assert person["name"] == "Denis Villeneuve"
-                assert person["known_for_department"] == "Directing"
-                assert person["birthday"] == "1967-10-03"
-                assert person["profile_path"] == "/zdDx9Xs93UIrJFWYApYR28J8M6b.jpg"
-                assert "biography" in person
-
-    @pytest.mark.asyncio
-    async def test_get_movie_credits(self, mock_response):
-        """Test getting movie credits."""
-        with patch("src.media.tmdb.settings") as mock_settings:
-            mock_settings.tmdb_api_key.get_secret_value.return_value = "test_key"
-            mock_settings.cache_ttl = 3600
-
-            async with TMDBClient() as client:
-                client._client = MagicMock(spec=httpx.AsyncClient)
-                client._client.get = AsyncMock(return_value=mock_response(SAMPLE_CREDITS))
-
-                credits = await client.get_movie_credits(27205)
-
-                assert len(credits.cast) == 2
-                assert credits.cast[0].name == "Leonardo DiCaprio"
-                assert credits.cast[0].character == "Cobb"
-                assert len(credits.crew) == 2
-                directors = credits.get_directors()
-                assert len(directors) == 1
-                assert directors[0].name == "Christopher Nolan"
-
-    @pytest.mark.asyncio
-    async def test_get_credits_movie(self, mock_response):
-        """Test get_credits for movies."""
-        with patch("src.media.tmdb.settings") as mock_settings:
-            mock_settings.tmdb_api_key.get_secret_value.return_value = "test_key"
-            mock_settings.cache_ttl = 3600
+        tmdb_client._client.get.return_value = mock_response(SAMPLE_MOVIE_SEARCH_RESPONSE)
 
-            async with TMDBClient() as client:
-                client._client = MagicMock(spec=httpx.AsyncClient)
-                client._client.get = AsyncMock(return_value=mock_response(SAMPLE_CREDITS))
+        results = await tmdb_client.search_movie("Inception", year=2010)
 
-                credits = await client.get_credits(27205, MediaType.MOVIE)
-                assert len(credits.cast) == 2
+        assert len(results) == 2
+        # Verify year was passed in params
+        call_args = tmdb_client._client.get.call_args
+        assert "year" in call_args.kwargs["params"]
+        assert call_args.kwargs["params"]["year"] == 2010
 
-    @pytest.mark.asyncio
-    async def test_get_credits_invalid_type(self):
+    async def test_get_credits_invalid_type(self, tmdb_client):
         """Test get_credits with invalid media type."""
-        with patch("src.media.tmdb.settings") as mock_settings:
-            mock_settings.tmdb_api_key.get_secret_value.return_value = "test_key"
-            mock_settings.cache_ttl = 3600
-
-            async with TMDBClient() as client:
-                client._client = MagicMock(spec=httpx.AsyncClient)
-
-                with pytest.raises(ValueError, match="Invalid media type"):
-                    await client.get_credits(1, MediaType.PERSON)
-
-    @pytest.mark.asyncio
-    async def test_get_movie_recommendations(self, mock_response):
-        """Test getting movie recommendations."""
-        with patch("src.media.tmdb.settings") as mock_settings:
-            mock_settings.tmdb_api_key.get_secret_value.return_value = "test_key"
-            mock_settings.cache_ttl = 3600
-
-            async with TMDBClient() as client:
-                client._client = MagicMock(spec=httpx.AsyncClient)
-                client._client.get = AsyncMock(return_value=mock_response(SAMPLE_RECOMMENDATIONS))
-
-                results = await client.get_movie_recommendations(27205)
+        with pytest.raises(ValueError, match="Invalid media type"):
+            await tmdb_client.get_credits(1, MediaType.PERSON)
 
-                assert len(results) == 2
-                assert results[0].id == 157336
-                assert results[0].title == "Interstellar"
-                assert results[0].media_type == MediaType.MOVIE
-
-    @pytest.mark.asyncio
-    async def test_get_recommendations_movie(self, mock_response):
-        """Test get_recommendations for movies."""
-        with patch("src.media.tmdb.settings") as mock_settings:
-            mock_settings.tmdb_api_key.get_secret_value.return_value = "test_key"
-            mock_settings.cache_ttl = 3600
-
-            async with TMDBClient() as client:
-                client._client = MagicMock(spec=httpx.AsyncClient)
-                client._client.get = AsyncMock(return_value=mock_response(SAMPLE_RECOMMENDATIONS))
-
-                results = await client.get_recommendations(27205, MediaType.MOVIE)
-                assert len(results) == 2
-
-    @pytest.mark.asyncio
-    async def test_get_recommendations_invalid_type(self):
+    async def test_get_recommendations_invalid_type(self, tmdb_client):
         """Test get_recommendations with invalid media type."""
-        with patch("src.media.tmdb.settings") as mock_settings:
-            mock_settings.tmdb_api_key.get_secret_value.return_value = "test_key"
-            mock_settings.cache_ttl = 3600
-
-            async with TMDBClient() as client:
-                client._client = MagicMock(spec=httpx.AsyncClient)
-
-                with pytest.raises(ValueError, match="Invalid media type"):
-                    await client.get_recommendations(1, MediaType.PERSON)
+        with pytest.raises(ValueError, match="Invalid media type"):
+            await tmdb_client.get_recommendations(1, MediaType.PERSON)
 
-    @pytest.mark.asyncio
-    async def test_caching(self, mock_response):
+    async def test_caching(self, tmdb_client, mock_response):
         """Test that responses are cached."""
-        with patch("src.media.tmdb.settings") as mock_settings:
-            mock_settings.tmdb_api_key.get_secret_value.return_value = "test_key"
-            mock_settings.cache_ttl = 3600
+        tmdb_client._client.get.return_value = mock_response(SAMPLE_MOVIE_SEARCH_RESPONSE)
 
-            async with TMDBClient() as client:
-                client._client = MagicMock(spec=httpx.AsyncClient)
-                client._client.get = AsyncMock(
-                    return_value=mock_response(SAMPLE_MOVIE_SEARCH_RESPONSE)
-                )
+        # First call
+        await tmdb_client.search_movie("Inception")
+        assert tmdb_client._client.get.call_count == 1
 
-                # First call
-                await client.search_movie("Inception")
-                assert client._client.get.call_count == 1
+        # Second call should use cache
+        await tmdb_client.search_movie("Inception")
+        assert tmdb_client._client.get.call_count == 1
 
-                # Second call should use cache
-                await client.search_movie("Inception")
-                assert client._client.get.call_count == 1
-
-    @pytest.mark.asyncio
-    async def test_cache_clear(self, mock_response):
+    async def test_cache_clear(self, tmdb_client, mock_response):
         """Test clearing cache."""
-        with patch("src.media.tmdb.settings") as mock_settings:
-            mock_settings.tmdb_api_key.get_secret_value.return_value = "test_key"
-            mock_settings.cache_ttl = 3600
+        tmdb_client._client.get.return_value = mock_response(SAMPLE_MOVIE_SEARCH_RESPONSE)
 
-            async with TMDBClient() as client:
-                client._client = MagicMock(spec=httpx.AsyncClient)
-                client._client.get = AsyncMock(
-                    return_value=mock_response(SAMPLE_MOVIE_SEARCH_RESPONSE)
-                )
+        await tmdb_client.search_movie("Inception")
+        tmdb_client.clear_cache()
+        await tmdb_client.search_movie("Inception")
 
-                await client.search_movie("Inception")
-                client.clear_cache()
-                await client.search_movie("Inception")
-
-                # After clear, should make new request
-                assert client._client.get.call_count == 2
+        # After clear, should make new request
+        assert tmdb_client._client.get.call_count == 2
 
 
 # =============================================================================
@@ -879,105 +841,53 @@ class TestTMDBErrors:
         """Create a mock error HTTP response."""
 
         def _create_response(status_code: int, text: str = "Error"):
-            response = MagicMock(spec=httpx.Response)
-            response.status_code = status_code
-            response.text = text
-            response.headers = {"Retry-After": "5"}
-            return response
+            return FakeResponse(status_code=status_code, text=text, headers={"Retry-After": "5"})
 
         return _create_response
 
-    @pytest.mark.asyncio
-    async def test_not_found_error(self, mock_error_response):
+    async def test_not_found_error(self, tmdb_client, mock_error_response):
         """Test 404 error handling."""
-        with patch("src.media.tmdb.settings") as mock_settings:
-            mock_settings.tmdb_api_key.get_secret_value.return_value = "test_key"
-            mock_settings.cache_ttl = 3600
+        tmdb_client._client.get.return_value = mock_error_response(404, "Not Found")
 
-            async with TMDBClient() as client:
-                client._client = MagicMock(spec=httpx.AsyncClient)
-                client._client.get = AsyncMock(return_value=mock_error_response(404, "Not Found"))
-
-                with pytest.raises(TMDBNotFoundError, match="Resource not found"):
-                    await client.get_movie(999999)
+        with pytest.raises(TMDBNotFoundError, match="Resource not found"):
+            await tmdb_client.get_movie(999999)
 
-    @pytest.mark.asyncio
-    async def test_auth_error(self, mock_error_response):
+    async def test_auth_error(self, tmdb_client, mock_error_response):
         """Test 401 error handling."""
-        with patch("src.media.tmdb.settings") as mock_settings:
-            mock_settings.tmdb_api_key.get_secret_value.return_value = "invalid_key"
-            mock_settings.cache_ttl = 3600
+        tmdb_client._client.get.return_value = mock_error_response(401, "Unauthorized")
 
-            async with TMDBClient() as client:
-                client._client = MagicMock(spec=httpx.AsyncClient)
-                client._client.get = AsyncMock(
-                    return_value=mock_error_response(401, "Unauthorized")
-                )
+        with pytest.raises(TMDBAuthError, match="Invalid TMDB API key"):
+            await tmdb_client.search_movie("test")
 
-                with pytest.raises(TMDBAuthError, match="Invalid TMDB API key"):
-                    await client.search_movie("test")
-
-    @pytest.mark.asyncio
-    async def test_rate_limit_error(self, mock_error_response):
+    async def test_rate_limit_error(self, tmdb_client, mock_error_response):
         """Test 429 rate limit error handling."""
-        with patch("src.media.tmdb.settings") as mock_settings:
-            mock_settings.tmdb_api_key.get_secret_value.return_value = "test_key"
-            mock_settings.cache_ttl = 3600
+        tmdb_client._client.get.return_value = mock_error_response(429, "Too Many Requests")
 
-            async with TMDBClient() as client:
-                client._client = MagicMock(spec=httpx.AsyncClient)
-                client._client.get = AsyncMock(
-                    return_value=mock_error_response(429, "Too Many Requests")
-                )
-
-                with pytest.raises(TMDBRateLimitError) as exc_info:
-                    await client.search_movie("test")
+        with pytest.raises(TMDBRateLimitError) as exc_info:
+            await tmdb_client.search_movie("test")
 
-                assert exc_info.value.retry_after == 5
+        assert exc_info.value.retry_after == 5
 
-    @pytest.mark.asyncio
-    async def test_timeout_error(self):
+    async def test_timeout_error(self, tmdb_client):
         """Test timeout error handling."""
-        with patch("src.media.tmdb.settings") as mock_settings:
-            mock_settings.tmdb_api_key.get_secret_value.return_value = "test_key"
-            mock_settings.cache_ttl = 3600
+        tmdb_client._client.get.side_effect = httpx.TimeoutException("Timeout")
 
-            async with TMDBClient() as client:
-                client._client = MagicMock(spec=httpx.AsyncClient)
-                client._client.get = AsyncMock(side_effect=httpx.TimeoutException("Timeout"))
-
-                with pytest.raises(TMDBError, match="Request timeout"):
-                    await client.search_movie("test")
+        with pytest.raises(TMDBError, match="Request timeout"):
+            await tmdb_client.search_movie("test")
 
-    @pytest.mark.asyncio
-    async def test_http_error(self):
+    async def test_http_error(self, tmdb_client):
         """Test generic HTTP error handling."""
-        with patch("src.media.tmdb.settings") as mock_settings:
-            mock_settings.tmdb_api_key.get_secret_value.return_value = "test_key"
-            mock_settings.cache_ttl = 3600
-
-            async with TMDBClient() as client:
-                client._client = MagicMock(spec=httpx.AsyncClient)
-                client._client.get = AsyncMock(side_effect=httpx.HTTPError("Connection failed"))
+        tmdb_client._client.get.side_effect = httpx.HTTPError("Connection failed")
 
-                with pytest.raises(TMDBError, match="HTTP error"):
-                    await client.search_movie("test")
+        with pytest.raises(TMDBError, match="HTTP error"):
+            await tmdb_client.search_movie("test")
 
-    @pytest.mark.asyncio
-    async def test_generic_api_error(self, mock_error_response):
+    async def test_generic_api_error(self, tmdb_client, mock_error_response):
         """Test generic API error handling."""
-        with patch("src.media.tmdb.settings") as mock_settings:
-            mock_settings.tmdb_api_key.get_secret_value.return_value = "test_key"
-            mock_settings.cache_ttl = 3600
-
-            async with TMDBClient() as client:
-                client._client = MagicMock(spec=httpx.AsyncClient)
-                client._client.get = AsyncMock(
-                    return_value=mock_error_response(500, "Internal Server Error")
-                )
+        tmdb_client._client.get.return_value = mock_error_response(500, "Internal Server Error")
 
-                with pytest.raises(TMDBError, match="TMDB API error 500"):
-                    await client.search_movie("test")
+        with pytest.raises(TMDBError, match="TMDB API error 500"):
+            await tmdb_client.search_movie("test")
 
 
 # =============================================================================
@@ -7,7 +7,13 @@ Tests cover:
 - Error handling
 """
 
+import copy
 import json
+import runpy
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -159,6 +165,12 @@ class TestHelperFunctions:
         assert tools1 is not tools2
         assert tools1 == tools2
 
+    def test_get_tool_definitions_plain_data(self) -> None:
+        """get_tool_definitions should return plain dicts that serialize and copy."""
+        tools = get_tool_definitions()
+        assert json.loads(json.dumps(tools)) == tools
+        assert copy.deepcopy(tools) == tools
+
     def test_get_tool_by_name_found(self) -> None:
         """get_tool_by_name should return tool when found."""
         tool = get_tool_by_name("tmdb_search")
@@ -176,56 +188,70 @@ class TestHelperFunctions:
 # =============================================================================
 
 
-class TestToolValidation:
-    """Tests for tool input validation."""
-
-    def test_validate_valid_input(self) -> None:
-        """Valid input should return empty errors list."""
-        errors = validate_tool_input(
-            "tmdb_search",
-            {"query": "Dune", "year": 2021, "media_type": "movie"},
-        )
-        assert errors == []
-
-    def test_validate_missing_required_field(self) -> None:
-        """Missing required field should return error."""
-        errors = validate_tool_input("tmdb_search", {"year": 2021})
-        assert len(errors) == 1
-        assert "query" in errors[0]
-
-    def test_validate_invalid_enum_value(self) -> None:
-        """Invalid enum value should return error."""
-        errors = validate_tool_input(
-            "tmdb_search",
-            {"query": "Dune", "media_type": "invalid"},
-        )
-        assert len(errors) == 1
-        assert "media_type" in errors[0]
-        assert "movie" in errors[0]
+# (tool name, input, substrings expected in each returned error)
+VALIDATION_CASES = [
+    pytest.param(
+        "tmdb_search",
+        {"query": "Dune", "year": 2021, "media_type": "movie"},
+        [],
+        id="valid_input",
+    ),
+    pytest.param(
+        "tmdb_search",
+        {"year": 2021},
+        [("query",)],
+        id="missing_required_field",
+    ),
+    pytest.param(
+        "tmdb_search",
+        {"query": "Dune", "media_type": "invalid"},
+        [("media_type", "movie")],
+        id="invalid_enum_value",
+    ),
+    pytest.param(
+        "tmdb_search",
+        {"query": 123},
+        [("string",)],
+        id="invalid_type_string",
+    ),
+    pytest.param(
+        "tmdb_search",
+        {"query": "Dune", "year": "2021"},
+        [("integer",)],
+        id="invalid_type_integer",
+    ),
+    pytest.param(
+        "tmdb_search",
+        {"query": "Dune", "media_type": ["movie"]},
+        [("string",), ("movie",)],
+        id="unhashable_enum_value",
+    ),
+    pytest.param(
+        "unknown_tool",
+        {"foo": "bar"},
+        [("Unknown tool",)],
+        id="unknown_tool",
+    ),
+]
 
-    def test_validate_invalid_type_string(self) -> None:
-        """String field with wrong type should return error."""
-        errors = validate_tool_input(
-            "tmdb_search",
-            {"query": 123},  # Should be string
-        )
-        assert len(errors) == 1
-        assert "string" in errors[0]
 
-    def test_validate_invalid_type_integer(self) -> None:
-        """Integer field with wrong type should return error."""
-        errors = validate_tool_input(
-            "tmdb_search",
-            {"query": "Dune", "year": "2021"},  # Should be integer
-        )
-        assert len(errors) == 1
-        assert "integer" in errors[0]
+class TestToolValidation:
+    """Tests for tool input validation."""
 
-    def test_validate_unknown_tool(self) -> None:
-        """Unknown tool should return error."""
-        errors = validate_tool_input("unknown_tool", {"foo": "bar"})
-        assert len(errors) == 1
-        assert "Unknown tool" in errors[0]
+    @pytest.mark.parametrize(("tool_name", "tool_input", "expected"), VALIDATION_CASES)
+    def test_validate(
+        self,
+        tool_name: str,
+        tool_input: dict[str, Any],
+        expected: list[tuple[str, ...]],
+    ) -> None:
+        """Each error should contain the expected substrings, in order."""
+        errors = validate_tool_input(tool_name, tool_input)
+
+        assert len(errors) == len(expected), errors
+        for error, substrings in zip(errors, expected, strict=True):
+            for substring in substrings:
+                assert substring in error
 
     def test_validate_multiple_errors(self) -> None:
         """Multiple validation errors should all be returned."""
@@ -237,6 +263,25 @@ class TestToolValidation:
         assert any("tmdb_id" in e for e in errors)
         assert any("media_type" in e for e in errors)
 
+    def test_generated_validators_up_to_date(self) -> None:
+        """Generated validators module should match the current tool schemas."""
+        script = Path(__file__).parent.parent / "scripts" / "gen_tool_validators.py"
+        generator = runpy.run_path(str(script))
+
+        assert generator["OUTPUT_FILE"].read_text(encoding="utf-8") == generator["render"](), (
+            "Run scripts/gen_tool_validators.py to regenerate src/ai/_tool_validators.py"
+        )
+
+    def test_generator_runs_without_generated_module(self) -> None:
+        """The generator should not depend on the module it generates."""
+        root = Path(__file__).parent.parent
+        code = (
+            "import runpy, sys\n"
+            "sys.modules['src.ai._tool_validators'] = None\n"
+            "runpy.run_path('scripts/gen_tool_validators.py')['render']()\n"
+        )
+        subprocess.run([sys.executable, "-c", code], cwd=root, check=True)
+
 
 # =============================================================================
 # Tool Executor Tests
@@ -249,7 +294,7 @@ class TestToolExecutor:
     def test_executor_initialization(self) -> None:
         """Executor should initialize with empty handlers."""
         executor = ToolExecutor()
-        assert executor.get_registered_tools() == []
+        assert executor.get_registered_tools() == ()
 
     def test_register_handler(self) -> None:
         """Handler registration should work correctly."""
@@ -285,6 +330,20 @@ class TestToolExecutor:
         assert executor.has_handler("kinopoisk_search")
         assert len(executor.get_registered_tools()) == 2
 
+    def test_registered_tools_cached_until_registration(self) -> None:
+        """Registered tools tuple should be reused until a handler is added."""
+
+        async def handler(input_data: dict) -> str:
+            return "result"
+
+        executor = ToolExecutor()
+        executor.register_handler("tmdb_search", handler)
+        tools = executor.get_registered_tools()
+        assert executor.get_registered_tools() is tools
+
+        executor.register_handler("kinopoisk_search", handler)
+        assert executor.get_registered_tools() == ("tmdb_search", "kinopoisk_search")
+
     @pytest.mark.asyncio
     async def test_execute_success(self) -> None:
         """Tool execution should work correctly."""
@@ -353,6 +412,21 @@ class TestStubHandler:
         assert parsed["received_input"]["query"] == "Dune"
         assert parsed["received_input"]["year"] == 2021
 
+    @pytest.mark.asyncio
+    async def test_stub_handler_output_unchanged(self) -> None:
+        """Stub handler output should match serializing the full response dict."""
+        tool_input = {"query": "Дюна", "filters": [1, {"adult": None}]}
+        result = await stub_handler(tool_input)
+
+        assert result == json.dumps(
+            {
+                "status": "stub",
+                "message": "Handler not implemented yet",
+                "received_input": tool_input,
+            },
+            ensure_ascii=False,
+        )
+
     def test_create_executor_with_stubs(self) -> None:
         """create_executor_with_stubs should register all tools."""
         executor = create_executor_with_stubs()
@@ -360,6 +434,20 @@ class TestStubHandler:
         for tool in ALL_TOOLS:
             assert executor.has_handler(tool["name"]), f"Missing handler for {tool['name']}"
 
+    def test_executors_with_stubs_are_independent(self) -> None:
+        """Registering on one stub executor should not leak into another."""
+
+        async def handler(input_data: dict) -> str:
+            return "real"
+
+        first = create_executor_with_stubs()
+        first.register_handlers({"custom_tool": handler})
+        second = create_executor_with_stubs()
+
+        assert first.has_handler("custom_tool")
+        assert not second.has_handler("custom_tool")
+        assert len(second.get_registered_tools()) == len(ALL_TOOLS)
+
     @pytest.mark.asyncio
     async def test_executor_with_stubs_works(self) -> None:
         """Executor with stubs should execute all tools."""
@@ -8,11 +8,17 @@ Tests cover:
 - Database migrations
 """
 
-from datetime import UTC, datetime, timedelta
+import asyncio
+import base64
+import sqlite3
+from datetime import UTC, datetime, timedelta, timezone
 from pathlib import Path
+from typing import Any
+from unittest.mock import patch
 
 import pytest
-from cryptography.fernet import Fernet
+import pytest_asyncio
+from cryptography.fernet import Fernet, InvalidToken
 
 from src.user.storage import (
     CredentialType,
@@ -28,10 +34,20 @@ from src.user.storage import (
 # Fixtures
 # =============================================================================
 
+# Clock seen by storage code during tests (see frozen_now)
+FROZEN_NOW = datetime(2024, 1, 1, tzinfo=UTC)
 
-@pytest.fixture
+
+@pytest.fixture(autouse=True)
+def frozen_now(monkeypatch: pytest.MonkeyPatch) -> datetime:
+    """Freeze the storage clock so timestamps are fixed and cheap to produce."""
+    monkeypatch.setattr("src.user.storage._utcnow", lambda: FROZEN_NOW)
+    return FROZEN_NOW
+
+
+@pytest.fixture(scope="session")
 def encryption_key() -> str:
-    """Generate a valid Fernet key for testing."""
+    """Generate a valid Fernet key, shared by the whole test session."""
     return Fernet.generate_key().decode()
 
 
@@ -41,19 +57,43 @@ def temp_db_path(tmp_path: Path) -> Path:
     return tmp_path / "test_users.db"
 
 
+@pytest_asyncio.fixture(scope="session")
+async def schema_template() -> UserStorage:
+    """Migrated in-memory database, built once and copied into each storage."""
+    template = UserStorage(":memory:")
+    await template.connect()
+    yield template
+    await template.close()
+
+
+class TemplateStorage(UserStorage):
+    """In-memory storage whose schema is copied from a migrated template.
+
+    connect() opens and configures the connection as usual, but replaces the
+    migration step with a SQLite backup of the template.
+    """
+
+    def __init__(self, template: UserStorage, *args: Any, **kwargs: Any):
+        super().__init__(":memory:", *args, **kwargs)
+        self._template = template
+
+    async def _apply_migrations(self) -> None:
+        await self._template.db.backup(self.db)
+
+
 @pytest.fixture
-async def storage(temp_db_path: Path, encryption_key: str) -> UserStorage:
+async def storage(schema_template: UserStorage, encryption_key: str) -> UserStorage:
     """Create a user storage instance for testing."""
-    storage = UserStorage(temp_db_path, encryption_key)
+    storage = TemplateStorage(schema_template, encryption_key)
     await storage.connect()
     yield storage
     await storage.close()
 
 
 @pytest.fixture
-async def storage_no_encryption(temp_db_path: Path) -> UserStorage:
+async def storage_no_encryption(schema_template: UserStorage) -> UserStorage:
     """Create a user storage instance without encryption."""
-    storage = UserStorage(temp_db_path)
+    storage = TemplateStorage(schema_template)
     await storage.connect()
     yield storage
     await storage.close()
@@ -87,8 +127,8 @@ class TestUserModel:
             username="test",
             first_name="John",
             last_name="Doe",
-            created_at=datetime.now(UTC),
-            updated_at=datetime.now(UTC),
+            created_at=FROZEN_NOW,
+            updated_at=FROZEN_NOW,
         )
         assert user.display_name == "John Doe"
 
@@ -99,8 +139,8 @@ class TestUserModel:
             telegram_id=123,
             username="test",
             first_name="John",
-            created_at=datetime.now(UTC),
-            updated_at=datetime.now(UTC),
+            created_at=FROZEN_NOW,
+            updated_at=FROZEN_NOW,
         )
         assert user.display_name == "John"
 
@@ -110,8 +150,8 @@ class TestUserModel:
             id=1,
             telegram_id=123,
             username="test",
-            created_at=datetime.now(UTC),
-            updated_at=datetime.now(UTC),
+            created_at=FROZEN_NOW,
+            updated_at=FROZEN_NOW,
         )
         assert user.display_name == "@test"
 
@@ -120,11 +160,34 @@ class TestUserModel:
         user = User(
             id=1,
             telegram_id=123,
-            created_at=datetime.now(UTC),
-            updated_at=datetime.now(UTC),
+            created_at=FROZEN_NOW,
+            updated_at=FROZEN_NOW,
         )
         assert user.display_name == "User 123"
 
+    def test_user_display_name_follows_changes(self):
+        """Test display name reflects assigned fields and model copies.
+
+        Guards against caching display_name: a cached value goes stale when
+        fields are assigned or the model is copied with updates.
+        """
+        user = User(
+            id=1,
+            telegram_id=123,
+            username="test",
+            created_at=FROZEN_NOW,
+            updated_at=FROZEN_NOW,
+        )
+        assert user.display_name == "@test"
+
+        user.first_name = "John"
+        assert user.display_name == "John"
+        assert "display_name" not in user.model_dump()
+
+        renamed = user.model_copy(update={"first_name": "Jane"})
+        assert renamed.display_name == "Jane"
+        assert user.display_name == "John"
+
 
 # =============================================================================
 # Encryption Tests
@@ -153,9 +216,44 @@ class TestEncryptionHelper:
         encrypted1 = helper.encrypt(original)
         encrypted2 = helper.encrypt(original)
 
-        # Fernet includes timestamp, so encryptions differ
+        # Each encryption uses a fresh random nonce, so ciphertexts differ
         assert encrypted1 != encrypted2
 
+    def test_decrypts_legacy_fernet_values(self, encryption_key: str):
+        """Test values stored with the old Fernet scheme still decrypt."""
+        legacy = base64.b64encode(Fernet(encryption_key).encrypt(b"old_token")).decode()
+        helper = EncryptionHelper(encryption_key)
+
+        assert helper.decrypt(legacy) == "old_token"
+
+    def test_writes_legacy_fernet_by_default(self, encryption_key: str):
+        """Test new values stay readable by releases without v2 support."""
+        encrypted = EncryptionHelper(encryption_key).encrypt("new_token")
+
+        assert not encrypted.startswith("v2:")
+        assert Fernet(encryption_key).decrypt(base64.b64decode(encrypted)) == b"new_token"
+
+    def test_writes_aes_gcm_when_enabled(self, encryption_key: str):
+        """Test write_aead switches new values to the v2 format."""
+        aead = EncryptionHelper(encryption_key, write_aead=True)
+        encrypted = aead.encrypt("new_token")
+
+        assert encrypted.startswith("v2:")
+        assert aead.decrypt(encrypted) == "new_token"
+        assert EncryptionHelper(encryption_key).decrypt(encrypted) == "new_token"
+
+    def test_decrypt_rejects_tampered_or_foreign_data(self, encryption_key: str):
+        """Test tampered ciphertext or a different key raises InvalidToken."""
+        helper = EncryptionHelper(encryption_key, write_aead=True)
+        encrypted = helper.encrypt("secret")
+        flipped = "A" if encrypted[20] != "A" else "B"
+        tampered = encrypted[:20] + flipped + encrypted[21:]
+
+        with pytest.raises(InvalidToken):
+            helper.decrypt(tampered)
+        with pytest.raises(InvalidToken):
+            EncryptionHelper(Fernet.generate_key()).decrypt(encrypted)
+
     def test_accepts_bytes_key(self):
         """Test encryption helper accepts bytes key."""
         key = Fernet.generate_key()
@@ -166,6 +264,24 @@ class TestEncryptionHelper:
 
         assert decrypted == "test"
 
+    def test_helper_shared_per_key(self, encryption_key: str):
+        """Test storages with the same key share one encryption helper."""
+        first = UserStorage(":memory:", encryption_key)
+        second = UserStorage(":memory:", encryption_key.encode())
+        other = UserStorage(":memory:", Fernet.generate_key())
+
+        assert first._encryption is second._encryption
+        assert other._encryption is not first._encryption
+
+    def test_fernet_built_once(self, encryption_key: str):
+        """Test the Fernet instance is built at init and reused per operation."""
+        with patch("src.user.storage.Fernet", wraps=Fernet) as fernet_cls:
+            helper = EncryptionHelper(encryption_key)
+            for value in ("a", "b", "c"):
+                assert helper.decrypt(helper.encrypt(value)) == value
+
+        assert fernet_cls.call_count == 1
+
 
 # =============================================================================
 # Migration Tests
@@ -175,7 +291,6 @@ class TestEncryptionHelper:
 class TestMigrations:
     """Tests for database migrations."""
 
-    @pytest.mark.asyncio
     async def test_migrations_applied_on_connect(self, temp_db_path: Path):
         """Test all migrations are applied when connecting."""
         storage = UserStorage(temp_db_path)
@@ -199,6 +314,95 @@ class TestMigrations:
 
         await storage.close()
 
+    async def test_lookup_indexes(self, storage: UserStorage):
+        """Test hot lookups are served by indexes rather than table scans."""
+        cursor = await storage.db.execute(
+            "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='watched'"
+        )
+        indexes = [row[0] for row in await cursor.fetchall()]
+        assert "idx_watched_user_time" in indexes
+
+        cursor = await storage.db.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM users WHERE telegram_id = ?", (1,)
+        )
+        plan = " ".join(row["detail"] for row in await cursor.fetchall())
+        assert "USING INDEX sqlite_autoindex_users" in plan
+
+        cursor = await storage.db.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM watched WHERE user_id = ? "
+            "ORDER BY watched_at DESC LIMIT 10",
+            (1,),
+        )
+        plan = " ".join(row["detail"] for row in await cursor.fetchall())
+        assert "idx_watched_user_time" in plan
+        assert "TEMP B-TREE" not in plan
+
+        for column, index in (
+            ("tmdb_id", "idx_watched_user_tmdb"),
+            ("kinopoisk_id", "idx_watched_user_kp"),
+        ):
+            cursor = await storage.db.execute(
+                f"EXPLAIN QUERY PLAN SELECT 1 FROM watched WHERE user_id = ? AND {column} = ? LIMIT 1",
+                (1, 2),
+            )
+            plan = " ".join(row["detail"] for row in await cursor.fetchall())
+            assert f"USING COVERING INDEX {index}" in plan
+
+        cursor = await storage.db.execute(
+            "EXPLAIN QUERY PLAN SELECT encrypted_value, expires_at FROM credentials "
+            "WHERE user_id = ? AND credential_type = ?",
+            (1, "trakt_token"),
+        )
+        plan = " ".join(row["detail"] for row in await cursor.fetchall())
+        assert "USING INDEX sqlite_autoindex_credentials" in plan
+
+    async def test_connect_enables_wal(self, temp_db_path: Path):
+        """Test connect switches the database to WAL journaling."""
+        storage = UserStorage(temp_db_path)
+        await storage.connect()
+        cursor = await storage.db.execute("PRAGMA journal_mode")
+        assert (await cursor.fetchone())[0] == "wal"
+
+        cursor = await storage.db.execute("PRAGMA synchronous")
+        assert (await cursor.fetchone())[0] == 1  # NORMAL
+
+        await storage.close()
+
+    async def test_user_version_gates_reconnect(self, temp_db_path: Path):
+        """Test reconnecting to a migrated database skips the migration block."""
+        storage = UserStorage(temp_db_path)
+        await storage.connect()
+        cursor = await storage.db.execute("PRAGMA user_version")
+        version = (await cursor.fetchone())[0]
+        await storage.close()
+
+        assert version > 0
+
+        with patch("src.user.storage.logger") as mock_logger:
+            await storage.connect()
+        await storage.close()
+
+        applied = [c for c in mock_logger.info.call_args_list if c.args == ("applying_migration",)]
+        assert applied == []
+
+    async def test_legacy_database_without_user_version(self, temp_db_path: Path):
+        """Test databases tracked only by _migrations are not re-migrated."""
+        storage = UserStorage(temp_db_path)
+        await storage.connect()
+        await storage.db.execute("PRAGMA user_version = 0")
+        await storage.db.commit()
+        await storage.close()
+
+        with patch("src.user.storage.logger") as mock_logger:
+            await storage.connect()
+        cursor = await storage.db.execute("PRAGMA user_version")
+        version = (await cursor.fetchone())[0]
+        await storage.close()
+
+        applied = [c for c in mock_logger.info.call_args_list if c.args == ("applying_migration",)]
+        assert applied == []
+        assert version > 0
+
 
 # =============================================================================
 # User CRUD Tests
@@ -208,7 +412,6 @@ class TestMigrations:
 class TestUserCRUD:
     """Tests for user CRUD operations."""
 
-    @pytest.mark.asyncio
     async def test_create_user(self, storage: UserStorage):
         """Test creating a new user."""
         user = await storage.create_user(
@@ -227,7 +430,6 @@ class TestUserCRUD:
         assert user.language_code == "ru"
         assert user.is_active is True
 
-    @pytest.mark.asyncio
     async def test_create_user_minimal(self, storage: UserStorage):
         """Test creating user with minimal info."""
         user = await storage.create_user(telegram_id=999888777)
@@ -236,7 +438,6 @@ class TestUserCRUD:
         assert user.username is None
         assert user.language_code == "ru"  # Default
 
-    @pytest.mark.asyncio
     async def test_create_user_also_creates_preferences(self, storage: UserStorage):
         """Test that creating user also creates default preferences."""
         user = await storage.create_user(telegram_id=444555666)
@@ -246,7 +447,6 @@ class TestUserCRUD:
         assert prefs.user_id == user.id
         assert prefs.video_quality == "1080p"
 
-    @pytest.mark.asyncio
     async def test_get_user_by_id(self, storage: UserStorage, sample_user: User):
         """Test getting user by internal ID."""
         user = await storage.get_user(sample_user.id)
@@ -255,7 +455,6 @@ class TestUserCRUD:
         assert user.id == sample_user.id
         assert user.telegram_id == sample_user.telegram_id
 
-    @pytest.mark.asyncio
     async def test_get_user_by_telegram_id(self, storage: UserStorage, sample_user: User):
         """Test getting user by Telegram ID."""
         user = await storage.get_user_by_telegram_id(sample_user.telegram_id)
@@ -263,13 +462,42 @@ class TestUserCRUD:
         assert user is not None
         assert user.telegram_id == sample_user.telegram_id
 
-    @pytest.mark.asyncio
+    async def test_get_user_field_types(self, storage: UserStorage, sample_user: User):
+        """Test users loaded from rows keep converted field types."""
+        user = await storage.get_user(sample_user.id)
+
+        assert user is not None
+        assert user.is_active is True
+        assert isinstance(user.created_at, datetime)
+        assert isinstance(user.updated_at, datetime)
+        assert user == sample_user
+
+    async def test_update_user_visible_by_telegram_id(
+        self, storage: UserStorage, sample_user: User
+    ):
+        """Test Telegram ID lookups see a user's updated profile, not a cached copy."""
+        await storage.get_user_by_telegram_id(sample_user.telegram_id)
+        await storage.update_user(sample_user.id, username="renamed")
+
+        user = await storage.get_user_by_telegram_id(sample_user.telegram_id)
+
+        assert user is not None
+        assert user.username == "renamed"
+
+    async def test_delete_user_visible_by_telegram_id(
+        self, storage: UserStorage, sample_user: User
+    ):
+        """Test deleted users are no longer found by Telegram ID, even after a lookup."""
+        await storage.get_user_by_telegram_id(sample_user.telegram_id)
+        await storage.delete_user(sample_user.id)
+
+        assert await storage.get_user_by_telegram_id(sample_user.telegram_id) is None
+
     async def test_get_user_not_found(self, storage: UserStorage):
         """Test getting non-existent user returns None."""
         user = await storage.get_user(99999)
         assert user is None
 
-    @pytest.mark.asyncio
     async def test_get_or_create_user_creates(self, storage: UserStorage):
         """Test get_or_create creates new user."""
         user, created = await storage.get_or_create_user(
@@ -280,7 +508,6 @@ class TestUserCRUD:
         assert created is True
         assert user.telegram_id == 777888999
 
-    @pytest.mark.asyncio
     async def test_get_or_create_user_gets_existing(self, storage: UserStorage, sample_user: User):
         """Test get_or_create returns existing user."""
         user, created = await storage.get_or_create_user(
@@ -290,7 +517,6 @@ class TestUserCRUD:
         assert created is False
         assert user.id == sample_user.id
 
-    @pytest.mark.asyncio
     async def test_get_or_create_updates_info(self, storage: UserStorage, sample_user: User):
         """Test get_or_create updates user info if changed."""
         user, created = await storage.get_or_create_user(
@@ -303,7 +529,6 @@ class TestUserCRUD:
         assert user.username == "newusername"
         assert user.first_name == "NewFirst"
 
-    @pytest.mark.asyncio
     async def test_update_user(self, storage: UserStorage, sample_user: User):
         """Test updating user profile."""
         updated = await storage.update_user(
@@ -316,13 +541,11 @@ class TestUserCRUD:
         assert updated.username == "updatedname"
         assert updated.language_code == "de"
 
-    @pytest.mark.asyncio
     async def test_update_user_not_found(self, storage: UserStorage):
         """Test updating non-existent user returns None."""
         updated = await storage.update_user(99999, username="test")
         assert updated is None
 
-    @pytest.mark.asyncio
     async def test_delete_user(self, storage: UserStorage, sample_user: User):
         """Test deleting a user."""
         deleted = await storage.delete_user(sample_user.id)
@@ -331,29 +554,23 @@ class TestUserCRUD:
         user = await storage.get_user(sample_user.id)
         assert user is None
 
-    @pytest.mark.asyncio
     async def test_delete_user_not_found(self, storage: UserStorage):
         """Test deleting non-existent user returns False."""
         deleted = await storage.delete_user(99999)
         assert deleted is False
 
-    @pytest.mark.asyncio
     async def test_list_users(self, storage: UserStorage):
         """Test listing users."""
         # Create multiple users
-        await storage.create_user(telegram_id=1001)
-        await storage.create_user(telegram_id=1002)
-        await storage.create_user(telegram_id=1003)
+        await storage.create_users_bulk([{"telegram_id": tg_id} for tg_id in (1001, 1002, 1003)])
 
         users = await storage.list_users(limit=10)
         assert len(users) >= 3
 
-    @pytest.mark.asyncio
     async def test_list_users_pagination(self, storage: UserStorage):
         """Test listing users with pagination."""
         # Create users
-        for i in range(5):
-            await storage.create_user(telegram_id=2000 + i)
+        await storage.create_users_bulk([{"telegram_id": 2000 + i} for i in range(5)])
 
         page1 = await storage.list_users(limit=2, offset=0)
         page2 = await storage.list_users(limit=2, offset=2)
@@ -362,16 +579,76 @@ class TestUserCRUD:
         assert len(page2) == 2
         assert page1[0].id != page2[0].id
 
+    async def test_create_users_bulk(self, storage: UserStorage):
+        """Test bulk user creation returns users in input order with preferences."""
+        users = await storage.create_users_bulk(
+            [
+                {"telegram_id": 3002, "username": "second"},
+                {"telegram_id": 3001, "first_name": "First", "language_code": "en"},
+            ]
+        )
+
+        assert [u.telegram_id for u in users] == [3002, 3001]
+        assert users[0].username == "second"
+        assert users[1].first_name == "First"
+        assert users[1].language_code == "en"
+        assert users[0].language_code == "ru"
+
+        for user in users:
+            fetched = await storage.get_user(user.id)
+            assert fetched is not None
+            assert fetched.telegram_id == user.telegram_id
+            cursor = await storage.db.execute(
+                "SELECT COUNT(*) FROM preferences WHERE user_id = ?", (user.id,)
+            )
+            assert (await cursor.fetchone())[0] == 1
+
+    async def test_create_users_bulk_rolls_back(self, storage: UserStorage, sample_user: User):
+        """Test a duplicate telegram_id aborts the whole batch."""
+        with pytest.raises(sqlite3.IntegrityError):
+            await storage.create_users_bulk(
+                [{"telegram_id": 4001}, {"telegram_id": sample_user.telegram_id}]
+            )
+
+        assert await storage.get_user_by_telegram_id(4001) is None
+
 
 # =============================================================================
 # Credentials Tests
 # =============================================================================
 
 
+class NullCipher:
+    """Pass-through Cipher for tests of storage semantics, not encryption."""
+
+    def encrypt(self, data: str) -> str:
+        return data
+
+    def decrypt(self, encrypted_data: str) -> str:
+        return encrypted_data
+
+
 class TestCredentials:
     """Tests for encrypted credential storage."""
 
-    @pytest.mark.asyncio
+    @pytest.fixture
+    async def storage(self, schema_template: UserStorage) -> UserStorage:
+        """Storage with a pass-through cipher; encryption is tested separately."""
+        storage = TemplateStorage(schema_template, cipher=NullCipher())
+        await storage.connect()
+        yield storage
+        await storage.close()
+
+    @pytest.fixture
+    async def encrypted_storage(
+        self, schema_template: UserStorage, encryption_key: str
+    ) -> UserStorage:
+        """Storage with the real cipher built from encryption_key."""
+        storage = TemplateStorage(schema_template, encryption_key)
+        await storage.connect()
+        yield storage
+        await storage.close()
+
     async def test_store_and_retrieve_credential(self, storage: UserStorage, sample_user: User):
         """Test storing and retrieving encrypted credential."""
         await storage.store_credential(
@@ -383,27 +660,26 @@ class TestCredentials:
         value = await storage.get_credential(sample_user.id, CredentialType.TRAKT_TOKEN)
         assert value == "secret_oauth_token"
 
-    @pytest.mark.asyncio
-    async def test_credential_encrypted_in_db(self, storage: UserStorage, sample_user: User):
+    async def test_credential_encrypted_in_db(self, encrypted_storage: UserStorage):
         """Test that credentials are actually encrypted in database."""
+        user = await encrypted_storage.create_user(telegram_id=12345)
         original = "my_secret_token"
-        await storage.store_credential(
-            user_id=sample_user.id,
+        await encrypted_storage.store_credential(
+            user_id=user.id,
             credential_type=CredentialType.TRAKT_TOKEN,
             value=original,
         )
 
         # Read raw value from database
-        cursor = await storage.db.execute(
+        cursor = await encrypted_storage.db.execute(
             "SELECT encrypted_value FROM credentials WHERE user_id = ?",
-            (sample_user.id,),
+            (user.id,),
         )
         row = await cursor.fetchone()
 
         # Should not contain plain text
-        assert original not in row["encrypted_value"]
+        assert original not in row[0]
 
-    @pytest.mark.asyncio
     async def test_store_credential_upsert(self, storage: UserStorage, sample_user: User):
         """Test that storing credential updates existing."""
         await storage.store_credential(
@@ -420,16 +696,14 @@ class TestCredentials:
         value = await storage.get_credential(sample_user.id, CredentialType.TRAKT_TOKEN)
         assert value == "second_value"
 
-    @pytest.mark.asyncio
     async def test_get_credential_not_found(self, storage: UserStorage, sample_user: User):
         """Test getting non-existent credential returns None."""
         value = await storage.get_credential(sample_user.id, CredentialType.SEEDBOX_PASSWORD)
         assert value is None
 
-    @pytest.mark.asyncio
     async def test_credential_expiration(self, storage: UserStorage, sample_user: User):
         """Test expired credentials return None."""
-        expired = datetime.now(UTC) - timedelta(hours=1)
+        expired = FROZEN_NOW - timedelta(hours=1)
 
         await storage.store_credential(
             user_id=sample_user.id,
@@ -441,7 +715,19 @@ class TestCredentials:
         value = await storage.get_credential(sample_user.id, CredentialType.TRAKT_TOKEN)
         assert value is None
 
-    @pytest.mark.asyncio
+        # Expiry is compared as an instant, whatever UTC offset it was stored with
+        await storage.store_credential(
+            user_id=sample_user.id,
+            credential_type=CredentialType.TRAKT_TOKEN,
+            value="live_token",
+            expires_at=(FROZEN_NOW + timedelta(minutes=30)).astimezone(
+                timezone(timedelta(hours=-5))
+            ),
+        )
+        assert (
+            await storage.get_credential(sample_user.id, CredentialType.TRAKT_TOKEN) == "live_token"
+        )
+
     async def test_delete_credential(self, storage: UserStorage, sample_user: User):
         """Test deleting a credential."""
         await storage.store_credential(
@@ -456,17 +742,21 @@ class TestCredentials:
         value = await storage.get_credential(sample_user.id, CredentialType.TRAKT_TOKEN)
         assert value is None
 
-    @pytest.mark.asyncio
     async def test_list_credentials(self, storage: UserStorage, sample_user: User):
         """Test listing credential types for user."""
-        await storage.store_credential(sample_user.id, CredentialType.TRAKT_TOKEN, "token")
-        await storage.store_credential(sample_user.id, CredentialType.SEEDBOX_PASSWORD, "pass")
+        stored = await storage.store_credentials_bulk(
+            sample_user.id,
+            {CredentialType.TRAKT_TOKEN: "token", CredentialType.SEEDBOX_PASSWORD: "pass"},
+        )
+        assert stored == 2
 
         types = await storage.list_credentials(sample_user.id)
         assert CredentialType.TRAKT_TOKEN in types
         assert CredentialType.SEEDBOX_PASSWORD in types
+        assert (
+            await storage.get_credential(sample_user.id, CredentialType.SEEDBOX_PASSWORD) == "pass"
+        )
 
-    @pytest.mark.asyncio
     async def test_store_credential_requires_encryption(self, storage_no_encryption: UserStorage):
         """Test storing credential fails without encryption key."""
         user = await storage_no_encryption.create_user(telegram_id=12345)
@@ -485,7 +775,6 @@ class TestCredentials:
 class TestPreferences:
     """Tests for user preferences."""
 
-    @pytest.mark.asyncio
     async def test_get_default_preferences(self, storage: UserStorage, sample_user: User):
         """Test getting default preferences."""
         prefs = await storage.get_preferences(sample_user.id)
@@ -495,7 +784,6 @@ class TestPreferences:
         assert prefs.audio_language == "ru"
         assert prefs.auto_download is False
 
-    @pytest.mark.asyncio
     async def test_update_preferences(self, storage: UserStorage, sample_user: User):
         """Test updating preferences."""
         prefs = await storage.update_preferences(
@@ -510,7 +798,6 @@ class TestPreferences:
         assert prefs.audio_language == "en"
         assert prefs.preferred_genres == ["sci-fi", "action"]
 
-    @pytest.mark.asyncio
     async def test_update_preferences_partial(self, storage: UserStorage, sample_user: User):
         """Test partial preference update."""
         # First update
@@ -528,7 +815,6 @@ class TestPreferences:
         assert prefs.video_quality == "720p"
         assert prefs.auto_download is True
 
-    @pytest.mark.asyncio
     async def test_preferences_genres_storage(self, storage: UserStorage, sample_user: User):
         """Test genres are stored as JSON arrays."""
         genres = ["drama", "comedy", "thriller"]
@@ -552,7 +838,6 @@ class TestPreferences:
 class TestWatchedItems:
     """Tests for watch history."""
 
-    @pytest.mark.asyncio
     async def test_add_watched_movie(self, storage: UserStorage, sample_user: User):
         """Test adding movie to watch history."""
         item = await storage.add_watched(
@@ -570,7 +855,6 @@ class TestWatchedItems:
         assert item.tmdb_id == 27205
         assert item.rating == 9.0
 
-    @pytest.mark.asyncio
     async def test_add_watched_tv_episode(self, storage: UserStorage, sample_user: User):
         """Test adding TV episode to watch history."""
         item = await storage.add_watched(
@@ -587,21 +871,30 @@ class TestWatchedItems:
         assert item.season == 1
         assert item.episode == 1
 
-    @pytest.mark.asyncio
     async def test_get_watched_history(self, storage: UserStorage, sample_user: User):
         """Test getting watch history."""
-        # Add multiple items
-        await storage.add_watched(sample_user.id, "movie", "Movie 1", tmdb_id=1)
-        await storage.add_watched(sample_user.id, "movie", "Movie 2", tmdb_id=2)
-        await storage.add_watched(sample_user.id, "tv", "TV Show", tmdb_id=3)
+        added = await storage.add_watched_bulk(
+            sample_user.id,
+            [
+                {"media_type": "movie", "title": "Movie 1", "tmdb_id": 1},
+                {"media_type": "movie", "title": "Movie 2", "tmdb_id": 2},
+                {
+                    "media_type": "tv",
+                    "title": "TV Show",
+                    "tmdb_id": 3,
+                    "watched_at": FROZEN_NOW + timedelta(days=1),
+                },
+            ],
+        )
+        assert added == 3
 
         all_items = await storage.get_watched(sample_user.id)
         assert len(all_items) == 3
+        assert all_items[0].title == "TV Show"
 
         movies = await storage.get_watched(sample_user.id, media_type="movie")
         assert len(movies) == 2
 
-    @pytest.mark.asyncio
     async def test_is_watched_by_tmdb_id(self, storage: UserStorage, sample_user: User):
         """Test checking if content is watched by TMDB ID."""
         await storage.add_watched(sample_user.id, "movie", "Test Movie", tmdb_id=12345)
@@ -609,7 +902,6 @@ class TestWatchedItems:
         assert await storage.is_watched(sample_user.id, tmdb_id=12345) is True
         assert await storage.is_watched(sample_user.id, tmdb_id=99999) is False
 
-    @pytest.mark.asyncio
     async def test_is_watched_by_kinopoisk_id(self, storage: UserStorage, sample_user: User):
         """Test checking if content is watched by Kinopoisk ID."""
         await storage.add_watched(sample_user.id, "movie", "Russian Movie", kinopoisk_id=654321)
@@ -617,16 +909,101 @@ class TestWatchedItems:
         assert await storage.is_watched(sample_user.id, kinopoisk_id=654321) is True
         assert await storage.is_watched(sample_user.id, kinopoisk_id=111111) is False
 
-    @pytest.mark.asyncio
     async def test_delete_watched(self, storage: UserStorage, sample_user: User):
         """Test deleting watched item."""
         item = await storage.add_watched(sample_user.id, "movie", "To Delete", tmdb_id=999)
+        assert await storage.exists_watched(item.id) is True
 
         deleted = await storage.delete_watched(item.id)
         assert deleted is True
+        assert await storage.exists_watched(item.id) is False
+
+    async def test_transaction_rollback(self, storage: UserStorage, sample_user: User):
+        """Test a failed transaction discards every write made inside it."""
+        with pytest.raises(RuntimeError, match="abort"):
+            async with storage.transaction():
+                await storage.add_watched(sample_user.id, "movie", "Movie 1", tmdb_id=1)
+                await storage.add_watched(sample_user.id, "movie", "Movie 2", tmdb_id=2)
+                raise RuntimeError("abort")
+
+        assert await storage.get_watched(sample_user.id) == []
+
+        await storage.add_watched(sample_user.id, "movie", "Movie 3", tmdb_id=3)
+        assert [item.title for item in await storage.get_watched(sample_user.id)] == ["Movie 3"]
+
+    async def test_nested_transaction_rollback(self, storage: UserStorage, sample_user: User):
+        """Test a failed nested transaction discards only its own writes."""
+        async with storage.transaction():
+            await storage.add_watched(sample_user.id, "movie", "Kept", tmdb_id=1)
+            with pytest.raises(RuntimeError, match="abort"):
+                async with storage.transaction():
+                    await storage.add_watched(sample_user.id, "movie", "Discarded", tmdb_id=2)
+                    raise RuntimeError("abort")
+
+        assert [item.title for item in await storage.get_watched(sample_user.id)] == ["Kept"]
+
+    async def test_concurrent_transactions(self, storage: UserStorage, sample_user: User):
+        """Test a transaction failing in one task leaves another task's writes intact."""
+        first_written = asyncio.Event()
+
+        async def failing() -> None:
+            async with storage.transaction():
+                await storage.add_watched(sample_user.id, "movie", "Discarded", tmdb_id=1)
+                first_written.set()
+                await asyncio.sleep(0)
+                raise RuntimeError("abort")
+
+        async def succeeding() -> None:
+            await first_written.wait()
+            await storage.add_watched_bulk(
+                sample_user.id, [{"media_type": "movie", "title": "Kept"}]
+            )
+
+        results = await asyncio.gather(failing(), succeeding(), return_exceptions=True)
+
+        assert isinstance(results[0], RuntimeError)
+        assert results[1] is None
+        assert [item.title for item in await storage.get_watched(sample_user.id)] == ["Kept"]
+
+    async def test_write_survives_failed_transaction_in_other_task(
+        self, storage: UserStorage, sample_user: User
+    ):
+        """Test a plain write from another task is not rolled back with a transaction."""
+        in_transaction = asyncio.Event()
+
+        async def failing() -> None:
+            async with storage.transaction():
+                await storage.add_watched(sample_user.id, "movie", "Discarded", tmdb_id=1)
+                in_transaction.set()
+                # Give the other task time to issue its write
+                await asyncio.sleep(0.05)
+                raise RuntimeError("abort")
+
+        async def writing() -> WatchedItem:
+            await in_transaction.wait()
+            return await storage.add_watched(sample_user.id, "movie", "Kept", tmdb_id=2)
+
+        results = await asyncio.gather(failing(), writing(), return_exceptions=True)
+
+        assert isinstance(results[0], RuntimeError)
+        assert isinstance(results[1], WatchedItem)
+        assert [item.title for item in await storage.get_watched(sample_user.id)] == ["Kept"]
+
+    async def test_task_spawned_in_transaction_waits_for_it(
+        self, storage: UserStorage, sample_user: User
+    ):
+        """Test a task started inside a transaction writes only after the block ends."""
+        async with storage.transaction():
+            await storage.add_watched(sample_user.id, "movie", "Outer", tmdb_id=1)
+            child = asyncio.create_task(
+                storage.add_watched(sample_user.id, "movie", "Child", tmdb_id=2)
+            )
+            await asyncio.sleep(0.01)
+            assert not child.done()
 
-        items = await storage.get_watched(sample_user.id)
-        assert all(i.id != item.id for i in items)
+        await child
+        titles = {item.title for item in await storage.get_watched(sample_user.id)}
+        assert titles == {"Outer", "Child"}
 
 
 # =============================================================================
@@ -637,7 +1014,6 @@ class TestWatchedItems:
 class TestContextManager:
     """Tests for context manager functionality."""
 
-    @pytest.mark.asyncio
     async def test_storage_context_manager(self, temp_db_path: Path, encryption_key: str):
         """Test storage works as async context manager."""
         async with UserStorage(temp_db_path, encryption_key) as storage:
@@ -647,14 +1023,12 @@ class TestContextManager:
         # Should be closed after context
         assert storage._db is None
 
-    @pytest.mark.asyncio
     async def test_get_user_storage_helper(self, temp_db_path: Path, encryption_key: str):
         """Test get_user_storage convenience function."""
         async with get_user_storage(temp_db_path, encryption_key) as storage:
             user = await storage.create_user(telegram_id=888999000)
             assert user is not None
 
-    @pytest.mark.asyncio
     async def test_db_property_raises_when_not_connected(self, temp_db_path: Path):
         """Test accessing db property raises when not connected."""
         storage = UserStorage(temp_db_path)
@@ -671,40 +1045,39 @@ class TestContextManager:
 class TestDataModels:
     """Tests for Pydantic data models."""
 
-    def test_credential_type_enum(self):
-        """Test CredentialType enum values."""
-        assert CredentialType.TRAKT_TOKEN.value == "trakt_token"
-        assert CredentialType.SEEDBOX_PASSWORD.value == "seedbox_password"
-
-    def test_preference_defaults(self):
-        """Test Preference model defaults."""
-        pref = Preference(
-            id=1,
-            user_id=1,
-            created_at=datetime.now(UTC),
-            updated_at=datetime.now(UTC),
-        )
-
-        assert pref.video_quality == "1080p"
-        assert pref.audio_language == "ru"
-        assert pref.preferred_genres == []
-        assert pref.excluded_genres == []
-        assert pref.auto_download is False
-        assert pref.notification_enabled is True
-
-    def test_watched_item_model(self):
-        """Test WatchedItem model."""
+    def test_model_invariants(self):
+        """Test CredentialType values and Preference/WatchedItem defaults."""
+        pref = Preference(id=1, user_id=1, created_at=FROZEN_NOW, updated_at=FROZEN_NOW)
         item = WatchedItem(
             id=1,
             user_id=1,
             media_type="movie",
             title="Test",
             tmdb_id=123,
-            watched_at=datetime.now(UTC),
-            created_at=datetime.now(UTC),
+            watched_at=FROZEN_NOW,
+            created_at=FROZEN_NOW,
         )
 
-        assert item.media_type == "movie"
-        assert item.tmdb_id == 123
-        assert item.season is None
-        assert item.episode is None
+        # One test for all three models: each check is a plain attribute read,
+        # so per-test setup would dominate if they were split up.
+        invariants = [
+            ("CredentialType.TRAKT_TOKEN", CredentialType.TRAKT_TOKEN.value, "trakt_token"),
+            (
+                "CredentialType.SEEDBOX_PASSWORD",
+                CredentialType.SEEDBOX_PASSWORD.value,
+                "seedbox_password",
+            ),
+            ("Preference.video_quality", pref.video_quality, "1080p"),
+            ("Preference.audio_language", pref.audio_language, "ru"),
+            ("Preference.preferred_genres", pref.preferred_genres, []),
+            ("Preference.excluded_genres", pref.excluded_genres, []),
+            ("Preference.auto_download", pref.auto_download, False),
+            ("Preference.notification_enabled", pref.notification_enabled, True),
+            ("WatchedItem.media_type", item.media_type, "movie"),
+            ("WatchedItem.tmdb_id", item.tmdb_id, 123),
+            ("WatchedItem.season", item.season, None),
+            ("WatchedItem.episode", item.episode, None),
+        ]
+        for name, actual, expected in invariants:
+            assert actual == expected, name
+            assert type(actual) is type(expected), name